@@ -0,0 +1,10 @@
+"""
+Pytest configuration for photo delete tests
+"""
+from moto import mock_aws
+
+# Import the shared service before test_app patches shared.config.config at
+# import time, so the shared modules keep the real config; under moto so
+# config lookups never reach a real SSM endpoint
+with mock_aws():
+    import shared.services.photo_service  # noqa: F401
@@ -0,0 +1,61 @@
+"""
+Unit tests for the shared photo service delete workflow
+"""
+import base64
+import io
+import pytest
+import boto3
+from moto import mock_aws
+from PIL import Image
+
+# Import under moto so config lookups never reach a real SSM endpoint
+with mock_aws():
+    from shared.models.photo import Photo
+    from shared.services.photo_service import PhotoService
+
+
+class TestPhotoServiceDelete:
+    """Test cases for PhotoService.delete_photo"""
+
+    @pytest.fixture
+    def photo_service(self):
+        """Photo service backed by a mock bucket and photo table"""
+        with mock_aws():
+            Photo.create_table(wait=True)
+            service = PhotoService()
+            boto3.client('s3', region_name='us-east-1').create_bucket(Bucket=service.bucket_name)
+            yield service
+
+    @pytest.fixture
+    def uploaded_photos(self, photo_service):
+        """Upload a profile photo for two entities"""
+        buffer = io.BytesIO()
+        Image.new('RGB', (900, 700), (50, 60, 70)).save(buffer, 'JPEG')
+        image_data = 'data:image/jpeg;base64,' + base64.b64encode(buffer.getvalue()).decode()
+        return {
+            entity_id: photo_service.upload_photo(image_data, 'user', entity_id, 'profile')
+            for entity_id in ('alice', 'bob')
+        }
+
+    def _object_count(self, photo_service):
+        """Number of objects left in the photo bucket"""
+        return boto3.client('s3', region_name='us-east-1').list_objects_v2(
+            Bucket=photo_service.bucket_name
+        )['KeyCount']
+
+    def test_delete_photo_by_id(self, photo_service, uploaded_photos):
+        """Test that deleting by photo ID removes its record and S3 objects only"""
+        result = photo_service.delete_photo(photo_id=uploaded_photos['alice']['photo_id'])
+
+        assert result['deleted_count'] == 1
+        assert result['s3_cleanup']['deleted_count'] == 3
+        assert [photo.photo_id for photo in Photo.scan()] == [uploaded_photos['bob']['photo_id']]
+        assert self._object_count(photo_service) == 3
+
+    def test_delete_photo_by_entity(self, photo_service, uploaded_photos):
+        """Test that deleting by entity removes every photo of that entity"""
+        result = photo_service.delete_photo(entity_type='user', entity_id='bob')
+
+        assert result['deleted_count'] == 1
+        assert [photo.photo_id for photo in Photo.scan()] == [uploaded_photos['alice']['photo_id']]
+        assert self._object_count(photo_service) == 3
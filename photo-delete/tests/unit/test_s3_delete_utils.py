@@ -0,0 +1,51 @@
+"""
+Unit tests for the shared S3 batch delete helper
+"""
+from unittest.mock import MagicMock
+from moto import mock_aws
+
+# Import under moto so config lookups never reach a real SSM endpoint
+with mock_aws():
+    from shared.utils import delete_s3_objects, S3_DELETE_BATCH_SIZE
+
+
+class TestDeleteS3Objects:
+    """Test cases for delete_s3_objects"""
+
+    def test_keys_are_deleted_in_batches_of_at_most_1000(self):
+        """Test that large key lists are split into DeleteObjects-sized chunks"""
+        s3_client = MagicMock()
+        s3_client.delete_objects.return_value = {}
+        keys = [f'user/alice/profile/{i}.jpg' for i in range(2500)]
+
+        result = delete_s3_objects('bucket', keys, s3_client=s3_client)
+
+        sizes = sorted(
+            len(call.kwargs['Delete']['Objects'])
+            for call in s3_client.delete_objects.call_args_list
+        )
+        assert S3_DELETE_BATCH_SIZE == 1000
+        assert sizes == [500, 1000, 1000]
+        assert result == {'deleted_count': 2500, 'failed_count': 0, 'errors': [], 'success': True}
+
+    def test_per_key_errors_are_aggregated(self):
+        """Test that keys S3 failed to delete are reported across chunks"""
+        s3_client = MagicMock()
+        s3_client.delete_objects.side_effect = lambda **kwargs: {
+            'Errors': [{'Key': kwargs['Delete']['Objects'][0]['Key'], 'Code': 'AccessDenied'}]
+        }
+        keys = [f'user/alice/profile/{i}.jpg' for i in range(1500)]
+
+        result = delete_s3_objects('bucket', keys, s3_client=s3_client)
+
+        assert result['deleted_count'] == 1498
+        assert result['failed_count'] == 2
+        assert len(result['errors']) == 2
+        assert result['success'] is False
+
+    def test_empty_key_list_makes_no_requests(self):
+        """Test that nothing is sent to S3 when there is nothing to delete"""
+        s3_client = MagicMock()
+
+        assert delete_s3_objects('bucket', [], s3_client=s3_client)['deleted_count'] == 0
+        s3_client.delete_objects.assert_not_called()
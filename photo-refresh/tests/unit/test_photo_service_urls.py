@@ -0,0 +1,39 @@
+"""
+Unit tests for presigned URL caching in the shared photo service
+"""
+import pytest
+from unittest.mock import patch
+from moto import mock_aws
+
+# Import under moto so config lookups never reach a real SSM endpoint
+with mock_aws():
+    from shared.services import photo_service as photo_service_module
+    from shared.services.photo_service import PhotoService
+
+
+class TestPresignedUrlCache:
+    """Test cases for PhotoService._get_cached_presigned_url"""
+
+    @pytest.fixture
+    def photo_service(self):
+        """Photo service with an empty presigned URL cache"""
+        photo_service_module._get_cached_presigned_url.cache_clear()
+        with mock_aws():
+            yield PhotoService(bucket_name='anecdotario-photos-test', presigned_url_expiry=3600)
+        photo_service_module._get_cached_presigned_url.cache_clear()
+
+    def test_signed_url_is_reused(self, photo_service):
+        """Test that repeated lookups within the TTL sign the URL once"""
+        with patch.object(photo_service_module, 'generate_presigned_url',
+                          return_value='https://signed') as sign:
+            assert photo_service._get_cached_presigned_url('bucket', 'key') == 'https://signed'
+            assert photo_service._get_cached_presigned_url('bucket', 'key') == 'https://signed'
+
+        sign.assert_called_once()
+
+    def test_failed_signing_is_not_cached(self, photo_service):
+        """Test that a signing failure is retried on the next lookup"""
+        with patch.object(photo_service_module, 'generate_presigned_url',
+                          side_effect=[None, 'https://signed']):
+            assert photo_service._get_cached_presigned_url('bucket', 'key') is None
+            assert photo_service._get_cached_presigned_url('bucket', 'key') == 'https://signed'
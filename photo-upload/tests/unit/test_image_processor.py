@@ -0,0 +1,77 @@
+"""
+Unit tests for the shared image processor
+"""
+import io
+import pytest
+from PIL import Image
+from moto import mock_aws
+
+# Import under moto so config lookups never reach a real SSM endpoint
+with mock_aws():
+    from shared.processors.image import ImageProcessor
+
+
+def _encode(image, image_format, **params):
+    """Encode a PIL image to bytes"""
+    buffer = io.BytesIO()
+    image.save(buffer, image_format, **params)
+    return buffer.getvalue()
+
+
+class TestImageProcessor:
+    """Test cases for ImageProcessor.process_image"""
+
+    @pytest.fixture
+    def processor(self):
+        """Image processor with default settings"""
+        return ImageProcessor()
+
+    def test_output_format_can_be_set_per_version(self, monkeypatch):
+        """Test that a version configured for WebP is encoded as WebP"""
+        monkeypatch.setenv('IMAGE_OUTPUT_FORMATS', '{"thumbnail": "webp"}')
+        image_data = _encode(Image.new('RGB', (400, 400), (10, 120, 200)), 'JPEG')
+
+        result = ImageProcessor().process_image(image_data)
+
+        assert result['processing_stats']['thumbnail']['format'] == 'WEBP'
+        assert Image.open(io.BytesIO(result['versions']['thumbnail'])).format == 'WEBP'
+        assert result['processing_stats']['standard']['format'] == 'JPEG'
+        assert Image.open(io.BytesIO(result['versions']['standard'])).format == 'JPEG'
+
+    @pytest.mark.parametrize('mode', ['RGBA', 'P', 'LA'])
+    def test_transparency_is_flattened_onto_white(self, processor, mode):
+        """Test that fully transparent pixels come out white"""
+        if mode == 'P':
+            image = Image.new('P', (200, 200), 0)
+            image.putpalette([0, 0, 0] * 256)
+            image_data = _encode(image, 'PNG', transparency=0)
+        else:
+            image_data = _encode(Image.new(mode, (200, 200)), 'PNG')
+        assert Image.open(io.BytesIO(image_data)).mode == mode
+
+        result = processor.process_image(image_data, {'thumbnail': (150, 150)})
+
+        thumbnail = Image.open(io.BytesIO(result['versions']['thumbnail']))
+        assert min(thumbnail.convert('RGB').getpixel((75, 75))) >= 250
+
+    def test_exif_rotation_swaps_reported_original_size(self, processor):
+        """Test that a 90-degree EXIF orientation reports the upright size"""
+        exif = Image.Exif()
+        exif[0x0112] = 6
+        image_data = _encode(Image.new('RGB', (400, 200), (90, 90, 90)), 'JPEG', exif=exif)
+
+        result = processor.process_image(image_data, {'thumbnail': (150, 150)})
+
+        assert result['original_info']['size'] == (200, 400)
+
+    def test_draft_decode_reports_uploaded_size(self, processor):
+        """Test that a reduced-scale JPEG decode still reports the uploaded dimensions"""
+        image_data = _encode(Image.new('RGB', (2000, 1600), (200, 30, 30)), 'JPEG')
+
+        image, original_size = processor._load_and_validate_image(image_data, max_target=150)
+        result = processor.process_image(image_data, {'thumbnail': (150, 150)})
+
+        assert image.size[0] < 2000
+        assert original_size == (2000, 1600)
+        assert result['original_info']['size'] == (2000, 1600)
+        assert result['original_info']['file_size'] == len(image_data)
@@ -0,0 +1,110 @@
+"""
+Unit tests for the shared photo service upload workflow
+"""
+import base64
+import io
+import pytest
+import boto3
+from concurrent.futures import Future
+from unittest.mock import patch
+from moto import mock_aws
+from PIL import Image
+
+# Import under moto so config lookups never reach a real SSM endpoint
+with mock_aws():
+    from shared.models.photo import Photo
+    from shared.services.photo_service import PhotoService
+
+
+class TestPhotoServiceUpload:
+    """Test cases for PhotoService.upload_photo"""
+
+    @pytest.fixture
+    def photo_service(self):
+        """Photo service backed by a mock bucket and photo table"""
+        with mock_aws():
+            Photo.create_table(wait=True)
+            service = PhotoService()
+            boto3.client('s3', region_name='us-east-1').create_bucket(Bucket=service.bucket_name)
+            yield service
+
+    @pytest.fixture
+    def image_data(self):
+        """Base64 data URL of a JPEG larger than the standard version"""
+        buffer = io.BytesIO()
+        Image.new('RGB', (1600, 1200), (120, 80, 40)).save(buffer, 'JPEG')
+        return 'data:image/jpeg;base64,' + base64.b64encode(buffer.getvalue()).decode()
+
+    def test_upload_photo_stores_every_version(self, photo_service, image_data):
+        """Test that an upload writes each version to S3 and one photo record"""
+        result = photo_service.upload_photo(image_data, 'user', 'alice', 'profile')
+
+        assert set(result['urls']) == {'thumbnail_url', 'standard_url', 'high_res_url'}
+        assert Photo.get(result['photo_id']).entity_id == 'alice'
+        objects = boto3.client('s3', region_name='us-east-1').list_objects_v2(
+            Bucket=photo_service.bucket_name
+        )
+        assert objects['KeyCount'] == 3
+
+    def test_upload_photo_reports_total_reduction(self, photo_service, image_data):
+        """Test that the reported reduction reflects the processed version sizes"""
+        metadata = photo_service.upload_photo(image_data, 'user', 'alice', 'profile')['metadata']
+
+        processed = sum(metadata['processed_sizes'].values())
+        change = (processed / metadata['original_size'] - 1) * 100
+        expected = f"{-change:.1f}%" if change < 0 else f"-{change:.1f}%"
+        assert metadata['total_reduction'] == expected
+        assert metadata['total_reduction'] != '0%'
+
+    def test_upload_photo_cleans_up_previous_photo(self, photo_service, image_data):
+        """Test that a new upload replaces the entity's previous photo of that type"""
+        first = photo_service.upload_photo(image_data, 'user', 'alice', 'profile')
+        second = photo_service.upload_photo(image_data, 'user', 'alice', 'profile')
+
+        assert second['cleanup_result']['deleted_count'] == 1
+        assert [photo.photo_id for photo in Photo.scan()] == [second['photo_id']]
+        assert second['photo_id'] != first['photo_id']
+        objects = boto3.client('s3', region_name='us-east-1').list_objects_v2(
+            Bucket=photo_service.bucket_name
+        )
+        assert objects['KeyCount'] == 3
+
+    def test_upload_fails_when_one_version_upload_fails(self, photo_service, image_data):
+        """Test that a failed version upload fails the photo and writes no record"""
+        def fake_upload(bucket_name, s3_key, data, content_type, s3_client):
+            return 'standard_' not in s3_key
+
+        with patch('shared.services.photo_service.upload_to_s3', side_effect=fake_upload):
+            with pytest.raises(Exception, match='Failed to upload versions'):
+                photo_service.upload_photo(image_data, 'user', 'alice', 'profile')
+
+        assert Photo.count() == 0
+
+    def test_collect_cancels_uploads_queued_after_failure(self, photo_service):
+        """Test that uploads not yet started are cancelled once a version failed"""
+        failed, queued = Future(), Future()
+        failed.set_result(False)
+        uploads = {'thumbnail': ('thumb-key', failed), 'standard': ('standard-key', queued)}
+
+        with pytest.raises(Exception, match='Failed to upload versions'):
+            photo_service._collect_version_uploads(
+                uploads, {'thumbnail': b'a', 'standard': b'b'}, 'photo-1'
+            )
+
+        assert queued.cancelled()
+
+    def test_upload_stores_webp_version_with_matching_key_and_type(self, photo_service, image_data):
+        """Test that a WebP version is stored under a .webp key as image/webp"""
+        with patch.dict(photo_service.image_processor.format_by_version, {'thumbnail': 'WEBP'}):
+            photo_service.upload_photo(image_data, 'user', 'alice', 'profile')
+
+        s3 = boto3.client('s3', region_name='us-east-1')
+        content_types = {
+            obj['Key']: s3.head_object(Bucket=photo_service.bucket_name, Key=obj['Key'])['ContentType']
+            for obj in s3.list_objects_v2(Bucket=photo_service.bucket_name)['Contents']
+        }
+        [thumbnail_key] = [key for key in content_types if 'thumbnail' in key]
+        assert thumbnail_key.endswith('.webp')
+        assert content_types.pop(thumbnail_key) == 'image/webp'
+        assert all(key.endswith('.jpg') for key in content_types)
+        assert set(content_types.values()) == {'image/jpeg'}
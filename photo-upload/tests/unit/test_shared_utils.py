@@ -0,0 +1,78 @@
+"""
+Unit tests for shared request/response utilities used by photo upload
+"""
+import base64
+import pytest
+from unittest.mock import patch
+from moto import mock_aws
+
+# Import under moto so config lookups never reach a real SSM endpoint
+with mock_aws():
+    from shared.config import Config
+    from shared.utils import create_response
+    from shared import validation_utils
+    from shared.constants import ImageConstants
+    from shared.exceptions import ValidationError
+
+
+class TestConfig:
+    """Test cases for settings read while modules are imported"""
+
+    def test_log_level_is_read_from_the_environment_only(self, monkeypatch):
+        """Test that the log level never falls back to an SSM lookup"""
+        monkeypatch.delenv('LOG_LEVEL', raising=False)
+        monkeypatch.delenv('COMMONS_SERVICE_LOG_LEVEL', raising=False)
+
+        with patch.object(Config, 'get_ssm_parameter') as get_ssm_parameter:
+            assert Config().log_level == 'INFO'
+            monkeypatch.setenv('LOG_LEVEL', 'warning')
+            assert Config().log_level == 'WARNING'
+
+        get_ssm_parameter.assert_not_called()
+
+
+class TestCreateResponse:
+    """Test cases for create_response"""
+
+    def test_default_headers_are_not_shared_between_responses(self):
+        """Test that mutating one response's headers leaves later responses untouched"""
+        first = create_response(200, '{}')
+        first['headers']['X-Request-Id'] = 'abc'
+
+        assert 'X-Request-Id' not in create_response(200, '{}')['headers']
+
+    def test_custom_headers_extend_defaults(self):
+        """Test that custom headers are merged over the defaults"""
+        headers = create_response(200, '{}', headers={'Cache-Control': 'no-store'})['headers']
+
+        assert headers['Cache-Control'] == 'no-store'
+        assert headers['Content-Type'] == 'application/json'
+
+
+class TestParseBase64Image:
+    """Test cases for validation_utils.parse_base64_image"""
+
+    def test_oversized_payload_is_rejected_before_decoding(self):
+        """Test that the size limit is enforced from the encoded length"""
+        image_data = 'data:image/png;base64,' + base64.b64encode(b'x' * 64).decode()
+
+        with patch.object(ImageConstants, 'MAX_FILE_SIZE', 32), \
+                patch.object(validation_utils, '_b64decode') as decode:
+            with pytest.raises(ValidationError, match='too large'):
+                validation_utils.parse_base64_image(image_data)
+
+        decode.assert_not_called()
+
+    def test_valid_payload_is_decoded(self):
+        """Test that a well-formed data URL yields its format and bytes"""
+        image_data = 'data:image/jpeg;base64,' + base64.b64encode(b'jpeg-bytes').decode()
+
+        assert validation_utils.parse_base64_image(image_data) == ('JPEG', b'jpeg-bytes')
+
+    def test_whitespace_wrapped_payload_is_rejected(self):
+        """Test that characters outside the base64 alphabet fail strict decoding"""
+        encoded = base64.b64encode(b'x' * 120).decode()
+        image_data = 'data:image/png;base64,' + encoded[:76] + '\n' + encoded[76:]
+
+        with pytest.raises(ValidationError, match='Invalid base64 image data'):
+            validation_utils.parse_base64_image(image_data)
@@ -38,11 +38,11 @@ class Config:
                 self._ssm_client = None
         return self._ssm_client
     
-    def get_parameter(self, key: str, default: Any = None) -> Any:
+    def get_parameter(self, key: str, default: Any = None, use_ssm: bool = True) -> Any:
         """
         Get configuration parameter with fallback hierarchy:
         1. Environment variable
-        2. SSM Parameter Store
+        2. SSM Parameter Store (skipped when use_ssm is False)
         3. Default value
         """
         # Try environment variable first (with commons service prefix)
@@ -57,6 +57,8 @@ class Config:
             return env_value
         
         # Try SSM Parameter Store
+        if not use_ssm:
+            return default
         ssm_value = self.get_ssm_parameter(key)
         if ssm_value is not None:
             return ssm_value
@@ -86,26 +88,26 @@ class Config:
             print(f"Unexpected error getting SSM parameter {parameter_name}: {e}")
             return None
     
-    def get_int_parameter(self, key: str, default: int = 0) -> int:
+    def get_int_parameter(self, key: str, default: int = 0, use_ssm: bool = True) -> int:
         """Get integer parameter"""
-        value = self.get_parameter(key, default)
+        value = self.get_parameter(key, default, use_ssm)
         try:
             return int(value)
         except (ValueError, TypeError):
             return default
     
-    def get_bool_parameter(self, key: str, default: bool = False) -> bool:
+    def get_bool_parameter(self, key: str, default: bool = False, use_ssm: bool = True) -> bool:
         """Get boolean parameter"""
-        value = self.get_parameter(key, default)
+        value = self.get_parameter(key, default, use_ssm)
         if isinstance(value, bool):
             return value
         if isinstance(value, str):
             return value.lower() in ('true', '1', 'yes', 'on')
         return default
     
-    def get_json_parameter(self, key: str, default: dict = None) -> dict:
+    def get_json_parameter(self, key: str, default: dict = None, use_ssm: bool = True) -> dict:
         """Get JSON parameter"""
-        value = self.get_parameter(key)
+        value = self.get_parameter(key, use_ssm=use_ssm)
         if value is None:
             return default or {}
         
@@ -146,16 +148,51 @@ class Config:
         """Get user-org table name"""
         return self.get_parameter('user-org-table-name', f'UserOrg-{self.environment}')
     
+    @property
+    def user_org_search_table_name(self) -> str:
+        """Get user-org search token table name"""
+        return self.get_parameter('user-org-search-table-name', f'UserOrgSearch-{self.environment}')
+    
+    @property
+    def user_org_token_search(self) -> bool:
+        """Get flag for serving text search from the search token table (env only; enable after the backfill)"""
+        return self.get_bool_parameter('user-org-token-search', False, use_ssm=False)
+    
+    @property
+    def user_org_cache_ttl(self) -> int:
+        """Get TTL in seconds for cached UserOrg lookups (0 disables)"""
+        return self.get_int_parameter('user-org-cache-ttl', 5)
+    
     @property
     def max_image_size(self) -> int:
         """Get maximum image size in bytes"""
         return self.get_int_parameter('max-image-size', 5 * 1024 * 1024)  # 5MB
     
+    @property
+    def max_image_pixels(self) -> int:
+        """Get maximum image area in pixels (decompression bomb guard; env only, read at import)"""
+        return self.get_int_parameter('max-image-pixels', 50_000_000, use_ssm=False)
+    
     @property
     def allowed_image_types(self) -> list:
         """Get allowed image MIME types"""
         return self.get_list_parameter('allowed-image-types', ['image/jpeg', 'image/png', 'image/webp'])
     
+    @property
+    def image_optimize_encoding(self) -> bool:
+        """Get flag for the extra Huffman optimization pass when encoding images (env only, read at import)"""
+        return self.get_bool_parameter('image-optimize-encoding', True, use_ssm=False)
+    
+    @property
+    def image_sharpen_thumbnails(self) -> bool:
+        """Get flag for sharpening thumbnail-sized image versions (env only, read at import)"""
+        return self.get_bool_parameter('image-sharpen-thumbnails', False, use_ssm=False)
+    
+    @property
+    def image_output_formats(self) -> dict:
+        """Get per-version image output formats (JSON, e.g. {"thumbnail": "WEBP"}; default JPEG; env only, read at import)"""
+        return self.get_json_parameter('image-output-formats', {}, use_ssm=False)
+    
     @property
     def presigned_url_expiry(self) -> int:
         """Get presigned URL expiry in seconds"""
@@ -166,6 +203,21 @@ class Config:
         """Get debug logging flag"""
         return self.get_bool_parameter('enable-debug-logging', False)
     
+    @property
+    def log_level(self) -> str:
+        """Get minimum log level (DEBUG, INFO, WARNING, ERROR, CRITICAL; env only, read at import)"""
+        return str(self.get_parameter('log-level', 'INFO', use_ssm=False)).upper()
+    
+    @property
+    def use_dax(self) -> bool:
+        """Get flag for routing UserOrg reads through DAX"""
+        return self.get_bool_parameter('use-dax', False)
+    
+    @property
+    def dax_endpoint(self) -> Optional[str]:
+        """Get DAX cluster discovery endpoint (dax:// or daxs://)"""
+        return self.get_parameter('dax-endpoint')
+    
     @property
     def cors_allowed_origins(self) -> list:
         """Get CORS allowed origins"""
@@ -174,6 +226,22 @@ class Config:
         return self.get_list_parameter('allowed-origins', [f'https://{self.environment}.anecdotario.com', 'https://anecdotario.com'])
 
 
+class LazyConfigValue:
+    """
+    Class attribute resolved from configuration on access
+
+    Lets class-level settings (e.g. PynamoDB Meta.table_name) read the
+    config when first used instead of at import time, so cold starts skip
+    the SSM lookup and env overrides set after import still apply.
+    """
+    
+    def __init__(self, getter):
+        self._getter = getter
+    
+    def __get__(self, instance, owner):
+        return self._getter()
+
+
 # Global configuration instance
 config = Config()
 
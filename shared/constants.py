@@ -2,6 +2,8 @@
 Commons Service Constants
 All constants needed for commons-service operations, migrated from anecdotario-commons
 """
+import re
+import sys
 
 
 class HTTPConstants:
@@ -84,11 +86,21 @@ class ImageConstants:
     THUMBNAIL_QUALITY = 85
     STANDARD_QUALITY = 90
     HIGH_RES_QUALITY = 95
+    WEBP_QUALITY = 75
+    
+    # Default square version sizes (pixels)
+    THUMBNAIL_SIZE = (150, 150)
+    STANDARD_SIZE = (320, 320)
+    HIGH_RES_SIZE = (800, 800)
     
     # Size limits (bytes)
     MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB
     MAX_DIMENSION = 2048  # pixels
     
+    # Output encodings
+    CONTENT_TYPES = {JPEG: 'image/jpeg', PNG: 'image/png', WEBP: 'image/webp'}
+    FILE_EXTENSIONS = {JPEG: 'jpg', PNG: 'png', WEBP: 'webp'}
+    
     # Base64 prefixes
     BASE64_JPEG_PREFIX = 'data:image/jpeg;base64,'
     BASE64_PNG_PREFIX = 'data:image/png;base64,'
@@ -102,9 +114,10 @@ class ValidationConstants:
     MIN_NICKNAME_LENGTH = 2
     MAX_NICKNAME_LENGTH = 30
     NICKNAME_PATTERN = r'^[a-zA-Z0-9_-]+$'
+    NICKNAME_RE = re.compile(NICKNAME_PATTERN)
     
     # Common reserved words used across all entity types
-    COMMON_RESERVED_WORDS = [
+    COMMON_RESERVED_WORDS = frozenset(map(sys.intern, (
         'admin', 'administrator', 'root', 'system', 'api', 'www',
         'mail', 'email', 'support', 'help', 'info', 'contact',
         'service', 'services', 'app', 'application', 'test', 'testing',
@@ -113,27 +126,27 @@ class ValidationConstants:
         'null', 'undefined', 'true', 'false', 'login', 'logout', 
         'register', 'signup', 'signin', 'auth', 'authentication', 
         'authorization', 'oauth', 'anecdotario'
-    ]
+    )))
     
     # Reserved words for different entity types
-    RESERVED_USER_NICKNAMES = COMMON_RESERVED_WORDS + [
+    RESERVED_USER_NICKNAMES = COMMON_RESERVED_WORDS | frozenset(map(sys.intern, (
         'user', 'users', 'account', 'accounts', 'profile', 'profiles',
         'settings', 'config', 'configuration', 'dashboard', 
         'moderator', 'mod', 'staff', 'team', 'story', 'stories', 
         'campaign', 'campaigns'
-    ]
+    )))
     
-    RESERVED_ORG_NICKNAMES = COMMON_RESERVED_WORDS + [
+    RESERVED_ORG_NICKNAMES = COMMON_RESERVED_WORDS | frozenset(map(sys.intern, (
         'organization', 'organizations', 'org', 'orgs', 'company',
         'companies', 'business', 'businesses', 'corporation', 'corp',
         'enterprise', 'group', 'team', 'official', 'verified',
         'brand', 'brands', 'partner', 'partners', 'sponsor', 'sponsors'
-    ]
+    )))
     
-    RESERVED_CAMPAIGN_NICKNAMES = COMMON_RESERVED_WORDS + [
+    RESERVED_CAMPAIGN_NICKNAMES = COMMON_RESERVED_WORDS | frozenset(map(sys.intern, (
         'campaign', 'campaigns', 'story', 'stories', 'collection',
         'collections', 'event', 'events', 'project', 'projects'
-    ]
+    )))
     
     # Name validation
     MIN_NAME_LENGTH = 1
@@ -172,6 +185,12 @@ class DatabaseConstants:
     DEFAULT_PAGE_SIZE = 20
     MAX_PAGE_SIZE = 100
     
+    # Connection tuning (shared across models)
+    CONNECT_TIMEOUT_SECONDS = 2
+    READ_TIMEOUT_SECONDS = 5
+    MAX_RETRY_ATTEMPTS = 3
+    MAX_POOL_CONNECTIONS = 50
+    
     # GSI names
     ENTITY_TYPE_INDEX = 'entity-type-index'
     ENTITY_PHOTOS_INDEX = 'entity-photos-index'
@@ -193,6 +212,12 @@ class S3Constants:
     # Default bucket regions
     DEFAULT_REGION = 'us-east-1'
     
+    # Client connection tuning (keep-alive pool shared by upload/delete threads)
+    CONNECT_TIMEOUT_SECONDS = 3
+    READ_TIMEOUT_SECONDS = 30
+    MAX_RETRY_ATTEMPTS = 3
+    MAX_POOL_CONNECTIONS = 32
+    
     # CORS settings
     CORS_MAX_AGE = 3600
     CORS_ALLOWED_METHODS = ['GET', 'PUT', 'POST', 'DELETE', 'HEAD']
@@ -1,7 +1,6 @@
 """
 AWS error handling utilities for commons-service
 """
-import json
 from typing import Dict, Any, Optional
 from botocore.exceptions import ClientError, BotoCoreError
 from pynamodb.exceptions import (
@@ -10,6 +9,7 @@ from pynamodb.exceptions import (
 )
 from .constants import HTTPConstants
 from .logger import logger
+from .json_utils import json_dumps
 
 
 class AWSErrorHandler:
@@ -298,7 +298,7 @@ class AWSErrorHandler:
                 'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token',
                 'Access-Control-Allow-Methods': 'GET,POST,PUT,DELETE,OPTIONS'
             },
-            'body': json.dumps(response_body)
+            'body': json_dumps(response_body)
         }
 
 
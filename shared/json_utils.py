@@ -0,0 +1,56 @@
+"""
+JSON serialization helpers for commons-service
+Uses orjson when available, with the stdlib json module as the fallback
+"""
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional, stdlib json is the fallback
+    orjson = None
+
+
+def json_dumps(value: Any) -> str:
+    """
+    Serialize value to a JSON string, using orjson when available
+
+    Args:
+        value: JSON-serializable value
+
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(value)
+
+
+def json_dumps_bytes(value: Any) -> bytes:
+    """
+    Serialize value to UTF-8 JSON bytes, using orjson when available
+
+    Args:
+        value: JSON-serializable value
+
+    Returns:
+        JSON bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value).encode('utf-8')
+
+
+def json_loads(value: Any) -> Any:
+    """
+    Deserialize a JSON string or bytes, using orjson when available
+
+    Args:
+        value: JSON string or bytes
+
+    Returns:
+        Deserialized value
+    """
+    if orjson is not None:
+        return orjson.loads(value)
+    return json.loads(value, strict=False)
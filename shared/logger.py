@@ -4,9 +4,12 @@ CloudWatch logging utilities for commons-service
 import json
 import sys
 import traceback
-from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 from .config import config
+from .validation_utils import utc_now_iso
+
+# Numeric severity per level name
+_LEVELS = {'debug': 10, 'info': 20, 'warning': 30, 'error': 40, 'critical': 50}
 
 
 class CommonsLogger:
@@ -18,11 +21,20 @@ class CommonsLogger:
         self.service_name = service_name
         self.environment = config.environment
         self.debug_enabled = config.enable_debug_logging
+        if self.debug_enabled:
+            self.min_level = _LEVELS['debug']
+        else:
+            self.min_level = _LEVELS.get(config.log_level.lower(), _LEVELS['info'])
+        # Lets callers skip building context for info records that would be dropped
+        self.info_enabled = self.min_level <= _LEVELS['info']
     
     def _log(self, level: str, message: str, **kwargs):
         """Internal log method with structured format"""
+        if _LEVELS[level] < self.min_level:
+            return
+        
         log_entry = {
-            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'timestamp': utc_now_iso(),
             'level': level.upper(),
             'service': self.service_name,
             'environment': self.environment,
@@ -116,6 +128,9 @@ class CommonsLogger:
     
     def log_service_operation(self, operation: str, entity_type: str = None, entity_id: str = None, **kwargs):
         """Log service operation"""
+        if not self.info_enabled:
+            return
+        
         log_data = {
             'operation': operation
         }
@@ -132,6 +147,9 @@ class CommonsLogger:
     
     def log_database_operation(self, table_name: str, operation: str, success: bool = True, **kwargs):
         """Log database operation"""
+        if success and not self.info_enabled:
+            return
+        
         log_data = {
             'table_name': table_name,
             'operation': operation,
@@ -147,6 +165,9 @@ class CommonsLogger:
     
     def log_s3_operation(self, bucket_name: str, operation: str, key: str = None, success: bool = True, **kwargs):
         """Log S3 operation"""
+        if success and not self.info_enabled:
+            return
+        
         log_data = {
             'bucket_name': bucket_name,
             'operation': operation,
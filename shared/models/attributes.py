@@ -0,0 +1,83 @@
+"""
+Custom PynamoDB attributes for commons-service models
+"""
+from typing import Any, Optional
+from pynamodb.attributes import JSONAttribute, UnicodeAttribute
+from ..json_utils import json_dumps, json_dumps_bytes, json_loads
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - msgpack is optional, JSON bytes are the fallback
+    msgpack = None
+
+
+def pack_bytes(value: Any) -> bytes:
+    """
+    Serialize a dict to a compact binary blob for cache storage
+
+    Uses MessagePack when available, otherwise JSON bytes
+
+    Args:
+        value: Dict to serialize
+
+    Returns:
+        Serialized bytes
+    """
+    if msgpack is not None:
+        return msgpack.packb(value, use_bin_type=True)
+    return json_dumps_bytes(value)
+
+
+def unpack_bytes(blob: bytes) -> Any:
+    """
+    Deserialize a blob produced by pack_bytes
+
+    JSON blobs start with '{' (never a valid MessagePack map header), so
+    blobs written by containers without msgpack still decode
+
+    Args:
+        blob: Serialized bytes
+
+    Returns:
+        Deserialized value
+    """
+    if blob[:1] == b'{' or msgpack is None:
+        return json_loads(blob)
+    return msgpack.unpackb(blob, raw=False)
+
+
+class OrjsonAttribute(JSONAttribute):
+    """
+    JSON attribute backed by orjson
+
+    Drop-in replacement for JSONAttribute; falls back to stdlib json
+    when orjson is not installed
+    """
+
+    def serialize(self, value) -> Optional[str]:
+        """Serialize JSON to unicode"""
+        if value is None:
+            return None
+        return json_dumps(value)
+
+    def deserialize(self, value):
+        """Deserialize JSON"""
+        return json_loads(value)
+
+
+class LowerUnicodeAttribute(UnicodeAttribute):
+    """
+    Unicode attribute stored lowercased
+
+    Used for case-insensitive keys. Values are lowercased on assignment, so
+    an instance always matches its stored item, and again in serialize, so
+    lookups and conditions built from raw values match too
+    """
+
+    def __set__(self, instance: Any, value: Optional[str]) -> None:
+        """Lowercase the value on assignment"""
+        super().__set__(instance, value.lower() if value else value)
+
+    def serialize(self, value):
+        """Serialize the lowercased value"""
+        return value.lower() if value else value
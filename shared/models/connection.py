@@ -0,0 +1,49 @@
+"""
+Process-wide DynamoDB connection shared by the PynamoDB models
+Keeps a single botocore client and keep-alive pool across warm Lambda invocations
+"""
+from functools import lru_cache
+from pynamodb.connection import Connection
+from pynamodb.exceptions import TableError
+from ..constants import DatabaseConstants
+
+
+@lru_cache(maxsize=None)
+def get_shared_connection(region: str) -> Connection:
+    """
+    Get the shared DynamoDB connection for a region
+
+    Args:
+        region: AWS region
+
+    Returns:
+        Cached PynamoDB Connection
+    """
+    return Connection(
+        region=region,
+        connect_timeout_seconds=DatabaseConstants.CONNECT_TIMEOUT_SECONDS,
+        read_timeout_seconds=DatabaseConstants.READ_TIMEOUT_SECONDS,
+        max_retry_attempts=DatabaseConstants.MAX_RETRY_ATTEMPTS,
+        max_pool_connections=DatabaseConstants.MAX_POOL_CONNECTIONS
+    )
+
+
+class SharedConnectionMixin:
+    """
+    Model mixin that binds the table connection to the shared Connection
+    instead of creating a client per model class
+    """
+
+    @classmethod
+    def _get_connection(cls):
+        """Returns the (cached) table connection backed by the shared Connection"""
+        table_connection = super()._get_connection()
+        shared_connection = get_shared_connection(cls.Meta.region)
+        if table_connection.connection is not shared_connection:
+            meta_table = table_connection.get_meta_table()
+            try:
+                shared_connection.get_meta_table(meta_table.table_name)
+            except TableError:
+                shared_connection.add_meta_table(meta_table)
+            table_connection.connection = shared_connection
+        return table_connection
@@ -0,0 +1,61 @@
+"""
+DynamoDB Accelerator (DAX) support for PynamoDB models
+Routes read-heavy model paths through a DAX cluster when enabled
+"""
+from functools import lru_cache
+from typing import Any, Dict
+from botocore import xform_name
+from pynamodb.connection import Connection
+from ..config import config
+
+try:
+    from amazondax import AmazonDaxClient
+except ImportError:  # pragma: no cover - DAX is opt-in, install amazon-dax-client to enable it
+    AmazonDaxClient = None
+
+
+@lru_cache(maxsize=1)
+def dax_enabled() -> bool:
+    """
+    Check whether reads should be routed through DAX
+
+    Returns:
+        True if DAX is enabled, an endpoint is configured and the client is installed
+    """
+    return bool(config.use_dax and config.dax_endpoint and AmazonDaxClient is not None)
+
+
+@lru_cache(maxsize=None)
+def _get_dax_client(endpoint_url: str, region: str):
+    """Process-wide DAX client (keeps one cluster connection per endpoint)"""
+    return AmazonDaxClient(endpoint_url=endpoint_url, region_name=region)
+
+
+class _DaxClientAdapter:
+    """
+    Expose the botocore-style `_make_api_call` used by PynamoDB on top of
+    the DAX client, which only implements the snake_case operation methods
+    """
+
+    def __init__(self, dax_client):
+        self._dax_client = dax_client
+
+    def _make_api_call(self, operation_name: str, operation_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        return getattr(self._dax_client, xform_name(operation_name))(**operation_kwargs)
+
+
+class DAXConnection(Connection):
+    """
+    PynamoDB connection that dispatches requests to a DAX cluster
+    """
+
+    def __init__(self, endpoint_url: str, region: str = None, **kwargs):
+        super().__init__(region=region, **kwargs)
+        self.endpoint_url = endpoint_url
+
+    @property
+    def client(self):
+        """Returns the DAX client wrapped for PynamoDB dispatch"""
+        if self._client is None:
+            self._client = _DaxClientAdapter(_get_dax_client(self.endpoint_url, self.region))
+        return self._client
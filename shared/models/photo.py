@@ -1,9 +1,8 @@
 """
 PynamoDB model for Photo entities
 """
-import os
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from pynamodb.models import Model
 from pynamodb.attributes import (
     UnicodeAttribute, UTCDateTimeAttribute, JSONAttribute, 
@@ -11,9 +10,19 @@ from pynamodb.attributes import (
 )
 from pynamodb.indexes import GlobalSecondaryIndex, AllProjection
 from pynamodb.exceptions import DoesNotExist, QueryError, PutError, UpdateError, DeleteError
-from ..config import config
+from ..config import config, LazyConfigValue
 from ..logger import photo_logger as logger
 from ..error_handler import error_handler
+from .connection import SharedConnectionMixin
+
+# DynamoDB BatchWriteItem limit
+_BATCH_WRITE_SIZE = 25
+
+# Attributes needed to delete a photo and its S3 objects
+_S3_KEY_ATTRIBUTES = (
+    'photo_id', 'photo_type', 'bucket_name',
+    'thumbnail_key', 'standard_key', 'high_res_key'
+)
 
 
 class EntityTypeIndex(GlobalSecondaryIndex):
@@ -36,14 +45,14 @@ class EntityPhotosIndex(GlobalSecondaryIndex):
     created_at = UTCDateTimeAttribute(range_key=True)
 
 
-class Photo(Model):
+class Photo(SharedConnectionMixin, Model):
     """
     Photo model for storing metadata about uploaded photos
     Supports users, orgs, campaigns, and other entity types
     """
     
     class Meta:
-        table_name = config.photo_table_name
+        table_name = LazyConfigValue(lambda: config.photo_table_name)
         region = 'us-east-1'
         billing_mode = 'PAY_PER_REQUEST'
     
@@ -216,7 +225,8 @@ class Photo(Model):
             raise Exception(error_response['error_message'])
     
     @classmethod
-    def get_entity_photos(cls, entity_type: str, entity_id: str, photo_type: str = None, limit: int = 50) -> List['Photo']:
+    def get_entity_photos(cls, entity_type: str, entity_id: str, photo_type: str = None, limit: int = 50,
+                          attributes_to_get: Optional[List[str]] = None) -> List['Photo']:
         """
         Get all photos for an entity
         
@@ -225,6 +235,8 @@ class Photo(Model):
             entity_id: Entity identifier  
             photo_type: Optional photo type filter
             limit: Maximum number of photos to return
+            attributes_to_get: Optional attribute projection (must include
+                               photo_type when filtering by it)
             
         Returns:
             List of Photo instances
@@ -235,7 +247,8 @@ class Photo(Model):
             query = cls.entity_photos_index.query(
                 entity_key,
                 limit=limit,
-                scan_index_forward=False  # Most recent first
+                scan_index_forward=False,  # Most recent first
+                attributes_to_get=attributes_to_get
             )
             
             photos = list(query)
@@ -268,6 +281,26 @@ class Photo(Model):
             error_response = error_handler.handle_dynamodb_error(e, 'get_entity_photos', cls.Meta.table_name)
             raise Exception(error_response['error_message'])
     
+    @classmethod
+    def get_entity_photo_keys(cls, entity_type: str, entity_id: str, photo_type: str = None,
+                              limit: int = 50) -> List['Photo']:
+        """
+        Get an entity's photos with only the attributes needed to delete them
+        
+        Args:
+            entity_type: Type of entity
+            entity_id: Entity identifier
+            photo_type: Optional photo type filter
+            limit: Maximum number of photos to return
+            
+        Returns:
+            List of partially loaded Photo instances (IDs, bucket and S3 keys)
+        """
+        return cls.get_entity_photos(
+            entity_type, entity_id, photo_type, limit,
+            attributes_to_get=list(_S3_KEY_ATTRIBUTES)
+        )
+    
     @classmethod
     def get_current_photo(cls, entity_type: str, entity_id: str, photo_type: str) -> Optional['Photo']:
         """
@@ -380,13 +413,53 @@ class Photo(Model):
             error_response = error_handler.handle_dynamodb_error(e, 'delete_photo', self.Meta.table_name)
             raise Exception(error_response['error_message'])
     
-    def to_dict(self, include_presigned_urls: bool = False, presigned_expiry: int = None) -> Dict[str, Any]:
+    @classmethod
+    def delete_photos(cls, photos: List['Photo']) -> Tuple[List[str], List[Dict[str, str]]]:
+        """
+        Hard delete photo records with BatchWriteItem (25 per request)
+        
+        Args:
+            photos: Photo instances to delete
+            
+        Returns:
+            Tuple of (deleted photo IDs, failures as {'photo_id', 'error'} dicts)
+        """
+        deleted_photo_ids = []
+        failures = []
+        
+        for start in range(0, len(photos), _BATCH_WRITE_SIZE):
+            chunk = photos[start:start + _BATCH_WRITE_SIZE]
+            try:
+                with cls.batch_write() as batch:
+                    for photo in chunk:
+                        batch.delete(photo)
+                deleted_photo_ids.extend(photo.photo_id for photo in chunk)
+            
+            except Exception as e:
+                failures.extend({'photo_id': photo.photo_id, 'error': str(e)} for photo in chunk)
+                logger.error("Failed to batch delete photo records",
+                            error=e,
+                            photo_ids=[photo.photo_id for photo in chunk])
+        
+        logger.log_database_operation(
+            table_name=cls.Meta.table_name,
+            operation='batch_delete',
+            success=not failures,
+            deleted_count=len(deleted_photo_ids),
+            failed_count=len(failures)
+        )
+        
+        return deleted_photo_ids, failures
+    
+    def to_dict(self, include_presigned_urls: bool = False, presigned_expiry: int = None,
+                s3_client=None) -> Dict[str, Any]:
         """
         Convert photo to dictionary representation
         
         Args:
             include_presigned_urls: Whether to generate presigned URLs
             presigned_expiry: Presigned URL expiry in seconds
+            s3_client: Optional S3 client used to sign the URLs
             
         Returns:
             Dictionary representation
@@ -413,11 +486,11 @@ class Photo(Model):
             expiry = presigned_expiry or config.presigned_url_expiry
             
             data['standard_url'] = generate_presigned_url(
-                self.bucket_name, self.standard_key, expiry
+                self.bucket_name, self.standard_key, expiry, s3_client
             ) if self.standard_key else None
             
             data['high_res_url'] = generate_presigned_url(
-                self.bucket_name, self.high_res_key, expiry  
+                self.bucket_name, self.high_res_key, expiry, s3_client
             ) if self.high_res_key else None
         
         # Optional fields
@@ -453,17 +526,7 @@ class Photo(Model):
             
             # Identify photos to delete
             photos_to_delete = all_photos[keep_count:]
-            deleted_photo_ids = []
-            
-            for photo in photos_to_delete:
-                try:
-                    photo.delete_photo()
-                    deleted_photo_ids.append(photo.photo_id)
-                except Exception as e:
-                    logger.error("Failed to delete old photo", 
-                               error=e,
-                               photo_id=photo.photo_id)
-                    # Continue with other deletions
+            deleted_photo_ids, _ = cls.delete_photos(photos_to_delete)
             
             if deleted_photo_ids:
                 logger.info("Old photos cleaned up",
@@ -0,0 +1,118 @@
+"""
+PynamoDB model for the UserOrg search token index
+Maps lowercased 3-grams of nickname/display_name/full_name to nicknames so
+text search can query candidates instead of scanning the UserOrg table
+"""
+from typing import Dict, Iterable, Iterator, Optional, Set
+from pynamodb.models import Model
+from pynamodb.attributes import UnicodeAttribute
+from ..config import config, LazyConfigValue
+from .connection import SharedConnectionMixin
+
+# Minimum query length served by the token index
+SEARCH_TOKEN_LENGTH = 3
+
+
+def generate_search_tokens(*values: str) -> Set[str]:
+    """
+    Generate lowercased 3-gram search tokens for the given values
+
+    Args:
+        values: Text values to index (None values are skipped)
+
+    Returns:
+        Set of tokens
+    """
+    tokens = set()
+    for value in values:
+        if not value:
+            continue
+        value = value.lower()
+        tokens.update(
+            value[i:i + SEARCH_TOKEN_LENGTH]
+            for i in range(len(value) - SEARCH_TOKEN_LENGTH + 1)
+        )
+    return tokens
+
+
+class UserOrgSearchToken(SharedConnectionMixin, Model):
+    """
+    Search token entry (token -> nickname)
+    """
+
+    class Meta:
+        table_name = LazyConfigValue(lambda: config.user_org_search_table_name)
+        region = 'us-east-1'
+        billing_mode = 'PAY_PER_REQUEST'
+
+    token = UnicodeAttribute(hash_key=True)
+    nickname = UnicodeAttribute(range_key=True)
+
+    @classmethod
+    def sync_tokens(cls, nickname: str, old_tokens: Iterable[str], new_tokens: Iterable[str]) -> None:
+        """
+        Write added tokens and delete stale ones for an entity
+
+        Args:
+            nickname: Entity nickname (rows are keyed by the lowercased value)
+            old_tokens: Tokens currently indexed for the entity
+            new_tokens: Tokens that should be indexed
+        """
+        nickname = nickname.lower()
+        old_tokens = set(old_tokens or ())
+        new_tokens = set(new_tokens or ())
+        if old_tokens == new_tokens:
+            return
+
+        with cls.batch_write() as batch:
+            for token in new_tokens - old_tokens:
+                batch.save(cls(token, nickname))
+            for token in old_tokens - new_tokens:
+                batch.delete(cls(token, nickname))
+
+    @classmethod
+    def delete_stale(cls, expected: Dict[str, Set[str]]) -> int:
+        """
+        Delete rows that don't belong to a currently indexed entity
+
+        Args:
+            expected: Tokens that should be indexed, keyed by lowercased nickname
+
+        Returns:
+            Number of rows deleted
+        """
+        deleted = 0
+        with cls.batch_write() as batch:
+            for entry in cls.scan():
+                if entry.token not in expected.get(entry.nickname, ()):
+                    batch.delete(entry)
+                    deleted += 1
+        return deleted
+
+    @classmethod
+    def iter_nicknames(
+        cls,
+        query_lower: str,
+        page_size: int = 100,
+        after: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Yield nicknames of candidate entities for a lowercased query, in nickname order
+
+        Args:
+            query_lower: Lowercased search query (at least SEARCH_TOKEN_LENGTH chars)
+            page_size: DynamoDB page size
+            after: Only yield nicknames sorting after this one (for paging)
+
+        Yields:
+            Candidate nicknames
+        """
+        token = query_lower[:SEARCH_TOKEN_LENGTH]
+        range_key_condition = cls.nickname > after if after else None
+        for entry in cls.query(
+            token,
+            range_key_condition=range_key_condition,
+            page_size=page_size,
+            attributes_to_get=['nickname']
+        ):
+            yield entry.nickname
@@ -2,18 +2,74 @@
 PynamoDB model for User-Organization entities
 Unified model for users and organizations with shared nickname space
 """
+import sys
+import time
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from operator import attrgetter
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Any
 from pynamodb.models import Model
 from pynamodb.attributes import (
-    UnicodeAttribute, UTCDateTimeAttribute, JSONAttribute, 
-    BooleanAttribute, NumberAttribute
+    UnicodeAttribute, UTCDateTimeAttribute,
+    BooleanAttribute, NumberAttribute, UnicodeSetAttribute
 )
 from pynamodb.indexes import GlobalSecondaryIndex, AllProjection
-from pynamodb.exceptions import DoesNotExist, QueryError, PutError, UpdateError, DeleteError
-from ..config import config
+from pynamodb.exceptions import (
+    DoesNotExist, QueryError, PutError, UpdateError, DeleteError, TransactWriteError, PynamoDBException
+)
+from botocore.exceptions import BotoCoreError, ClientError
+from pynamodb.transactions import TransactWrite
+from ..config import config, LazyConfigValue
 from ..logger import user_org_logger as logger
 from ..error_handler import error_handler
+from .attributes import LowerUnicodeAttribute, OrjsonAttribute, json_dumps_bytes, pack_bytes, unpack_bytes
+from .connection import SharedConnectionMixin
+from .dax import DAXConnection, dax_enabled
+from .search_index import UserOrgSearchToken, generate_search_tokens, SEARCH_TOKEN_LENGTH
+
+
+_REQUIRED_FIELDS = frozenset({'nickname', 'user_type', 'entity_id', 'display_name'})
+_VALID_USER_TYPES = frozenset(map(sys.intern, ('user', 'org')))
+_SENTINEL = object()
+
+# Timestamps whose ISO string is precomputed when the attribute is set
+_ISO_TIMESTAMP_FIELDS = frozenset({'created_at', 'updated_at'})
+
+# to_dict field layout, resolved with prebuilt attrgetters (key order is preserved)
+_DICT_FIELDS = (
+    'nickname', 'user_type', 'entity_id', 'display_name', 'full_name', 'bio',
+    'location', 'country', 'website', 'profile_photo_url', 'banner_photo_url',
+    'is_active', 'is_verified',
+)
+_DICT_JSON_FIELDS = ('social_links', 'tags', 'stats')
+_DICT_USER_FIELDS = ('first_name', 'last_name', 'date_of_birth')
+_DICT_ORG_FIELDS = ('org_type', 'founded_date', 'employee_count', 'industry')
+_DICT_SENSITIVE_FIELDS = ('email', 'phone', 'timezone', 'privacy_settings', 'metadata')
+_get_dict_fields = attrgetter(*_DICT_FIELDS)
+_get_dict_json_fields = attrgetter(*_DICT_JSON_FIELDS)
+_get_dict_sensitive_fields = attrgetter(*_DICT_SENSITIVE_FIELDS)
+_DICT_TYPE_FIELDS = {
+    'user': (_DICT_USER_FIELDS, attrgetter(*_DICT_USER_FIELDS)),
+    'org': (_DICT_ORG_FIELDS, attrgetter(*_DICT_ORG_FIELDS)),
+}
+
+# Items per TransactWriteItems request in bulk updates
+_BULK_UPDATE_CHUNK_SIZE = 25
+
+# Per-nickname write generation; bumping it invalidates cached lookups
+_nickname_generations: Dict[str, int] = {}
+
+# Attributes needed for the public (non-sensitive) to_dict representation;
+# search reads project to these instead of fetching full items
+_PUBLIC_ATTRIBUTES = [
+    'nickname', 'user_type', 'entity_id', 'display_name', 'full_name', 'bio',
+    'location', 'country', 'website', 'profile_photo_url', 'banner_photo_url',
+    'is_active', 'is_verified', 'is_certified', 'social_links', 'tags', 'stats',
+    'created_at', 'updated_at',
+    'first_name', 'last_name', 'date_of_birth',
+    'org_type', 'founded_date', 'employee_count', 'industry',
+]
 
 
 class UserTypeIndex(GlobalSecondaryIndex):
@@ -36,19 +92,19 @@ class CertifiedIndex(GlobalSecondaryIndex):
     created_at = UTCDateTimeAttribute(range_key=True)
 
 
-class UserOrg(Model):
+class UserOrg(SharedConnectionMixin, Model):
     """
     Unified model for users and organizations
     Maintains global nickname uniqueness across both entity types
     """
     
     class Meta:
-        table_name = config.user_org_table_name
+        table_name = LazyConfigValue(lambda: config.user_org_table_name)
         region = 'us-east-1'
         billing_mode = 'PAY_PER_REQUEST'
     
     # Primary key - nickname is globally unique
-    nickname = UnicodeAttribute(hash_key=True)
+    nickname = LowerUnicodeAttribute(hash_key=True)
     
     # Entity type and identification
     user_type = UnicodeAttribute()  # 'user' or 'org'
@@ -91,17 +147,17 @@ class UserOrg(Model):
     industry = UnicodeAttribute(null=True)
     
     # Social media links
-    social_links = JSONAttribute(default=dict)  # {platform: url}
+    social_links = OrjsonAttribute(default=dict)  # {platform: url}
     
     # Metadata
-    tags = JSONAttribute(default=list)  # List of tags/keywords
-    metadata = JSONAttribute(default=dict)  # Flexible additional data
+    tags = OrjsonAttribute(default=list)  # List of tags/keywords
+    metadata = OrjsonAttribute(default=dict)  # Flexible additional data
     
     # Privacy settings
-    privacy_settings = JSONAttribute(default=dict)
+    privacy_settings = OrjsonAttribute(default=dict)
     
     # Statistics
-    stats = JSONAttribute(default=dict)  # Follower counts, campaign counts, etc.
+    stats = OrjsonAttribute(default=dict)  # Follower counts, campaign counts, etc.
     
     # Timestamps
     created_at = UTCDateTimeAttribute(default=lambda: datetime.now(timezone.utc))
@@ -112,14 +168,56 @@ class UserOrg(Model):
     created_by = UnicodeAttribute(null=True)  # Who created this entity
     admin_notes = UnicodeAttribute(null=True)
     
+    # Search tokens currently written to the search token table
+    search_tokens = UnicodeSetAttribute(null=True)
+    
     # Global Secondary Indexes
     user_type_index = UserTypeIndex()
     certified_index = CertifiedIndex()
     
     def save(self, **kwargs):
-        """Override save to update timestamp"""
+        """Override save to update timestamp and search tokens"""
+        self._check_writable()
         self.updated_at = datetime.now(timezone.utc)
-        return super().save(**kwargs)
+        
+        old_tokens = self.search_tokens
+        new_tokens = generate_search_tokens(self.nickname, self.display_name, self.full_name)
+        self.search_tokens = new_tokens or None
+        
+        result = super().save(**kwargs)
+        self._invalidate_cached(self.nickname)
+        UserOrgSearchToken.sync_tokens(self.nickname, old_tokens, new_tokens)
+        return result
+    
+    def update(self, actions, **kwargs):
+        """Override update to invalidate cached lookups"""
+        result = super().update(actions, **kwargs)
+        self._invalidate_cached(self.nickname)
+        return result
+    
+    def delete(self, *args, **kwargs):
+        """Override delete to invalidate cached lookups and search tokens"""
+        self._check_writable()
+        result = super().delete(*args, **kwargs)
+        self._invalidate_cached(self.nickname)
+        UserOrgSearchToken.sync_tokens(self.nickname, self.search_tokens, ())
+        return result
+    
+    def _check_writable(self) -> None:
+        """
+        Refuse full writes from instances read with a projection
+        
+        Search reads only load the public attributes; saving one would drop
+        the rest of the item and deleting one would leak its search tokens.
+        
+        Raises:
+            ValueError: If the instance came from a projected read
+        """
+        if getattr(self, '_projected', False):
+            raise ValueError(
+                f"Entity '{self.nickname}' was read with a projection; "
+                "load it with get_by_nickname before saving or deleting it"
+            )
     
     @classmethod
     def create_entity(cls, entity_data: Dict[str, Any]) -> 'UserOrg':
@@ -136,14 +234,11 @@ class UserOrg(Model):
             ValueError: If required fields are missing or nickname exists
             Exception: If database operation fails
         """
-        required_fields = ['nickname', 'user_type', 'entity_id', 'display_name']
-        missing_fields = [field for field in required_fields if field not in entity_data]
-        
-        if missing_fields:
-            raise ValueError(f"Missing required fields: {missing_fields}")
+        if missing_fields := _REQUIRED_FIELDS.difference(entity_data):
+            raise ValueError(f"Missing required fields: {sorted(missing_fields)}")
         
         # Validate user_type
-        if entity_data['user_type'] not in ['user', 'org']:
+        if entity_data['user_type'] not in _VALID_USER_TYPES:
             raise ValueError("user_type must be 'user' or 'org'")
         
         # Check if nickname already exists
@@ -186,7 +281,14 @@ class UserOrg(Model):
                 created_by=entity_data.get('created_by')
             )
             
-            entity.save()
+            # Conditional put keeps nicknames unique even if the existence
+            # check above was served from a stale cache or raced another writer
+            try:
+                entity.save(condition=cls.nickname.does_not_exist())
+            except PutError as e:
+                if e.cause_response_code == 'ConditionalCheckFailedException':
+                    raise ValueError(f"Nickname '{entity_data['nickname']}' is already taken") from e
+                raise
             
             logger.log_database_operation(
                 table_name=cls.Meta.table_name,
@@ -199,6 +301,9 @@ class UserOrg(Model):
             
             return entity
             
+        except ValueError:
+            raise
+            
         except (PutError, Exception) as e:
             logger.log_database_operation(
                 table_name=cls.Meta.table_name,
@@ -211,11 +316,26 @@ class UserOrg(Model):
             error_response = error_handler.handle_dynamodb_error(e, 'create_entity', cls.Meta.table_name)
             raise Exception(error_response['error_message'])
     
+    @classmethod
+    def _read_model(cls) -> type:
+        """
+        Model class used for read-heavy paths
+
+        Returns:
+            UserOrgDAX when DAX is enabled, otherwise the class itself
+        """
+        if cls is UserOrg and dax_enabled():
+            return UserOrgDAX
+        return cls
+    
     @classmethod
     def get_by_nickname(cls, nickname: str) -> Optional['UserOrg']:
         """
         Get entity by nickname
         
+        Lookups are served from a short-TTL in-process cache that is
+        invalidated when this container writes the entity.
+        
         Args:
             nickname: Entity nickname
             
@@ -223,7 +343,31 @@ class UserOrg(Model):
             UserOrg instance or None if not found
         """
         try:
-            entity = cls.get(nickname)
+            ttl = config.user_org_cache_ttl
+            if ttl > 0:
+                # Keys are stored lowercased, so cache on the same form
+                cache_key = nickname.lower()
+                raw_data = _get_cached_raw_entity(
+                    cls._read_model(),
+                    cache_key,
+                    int(time.monotonic() // ttl),
+                    _nickname_generations.get(cache_key, 0)
+                )
+            else:
+                raw_data = _get_raw_entity(cls._read_model(), nickname)
+            
+            if raw_data is None:
+                logger.log_database_operation(
+                    table_name=cls.Meta.table_name,
+                    operation='get',
+                    success=False,
+                    nickname=nickname,
+                    error='Entity not found'
+                )
+                return None
+            
+            # Fresh instance per call so callers never share mutable state
+            entity = cls.from_raw_data(raw_data)
             
             logger.log_database_operation(
                 table_name=cls.Meta.table_name,
@@ -234,16 +378,6 @@ class UserOrg(Model):
             
             return entity
             
-        except DoesNotExist:
-            logger.log_database_operation(
-                table_name=cls.Meta.table_name,
-                operation='get',
-                success=False,
-                nickname=nickname,
-                error='Entity not found'
-            )
-            return None
-            
         except Exception as e:
             logger.log_database_operation(
                 table_name=cls.Meta.table_name,
@@ -256,6 +390,12 @@ class UserOrg(Model):
             error_response = error_handler.handle_dynamodb_error(e, 'get_by_nickname', cls.Meta.table_name)
             raise Exception(error_response['error_message'])
     
+    @staticmethod
+    def _invalidate_cached(nickname: str) -> None:
+        """Invalidate cached lookups for a nickname after a write"""
+        nickname = nickname.lower()
+        _nickname_generations[nickname] = _nickname_generations.get(nickname, 0) + 1
+    
     @classmethod
     def nickname_exists(cls, nickname: str) -> bool:
         """
@@ -270,15 +410,118 @@ class UserOrg(Model):
         return cls.get_by_nickname(nickname) is not None
     
     @classmethod
-    def search_entities(
-        cls, 
+    def _iter_entities(
+        cls,
         query: str = None,
-        user_type: str = None, 
+        user_type: str = None,
         is_certified: bool = None,
         limit: int = 50
-    ) -> List['UserOrg']:
+    ) -> Iterator['UserOrg']:
         """
-        Search entities with filters
+        Yield entities matching the filters as they arrive from DynamoDB
+        
+        Items are projected to the public attributes, so results are
+        read-only and only support to_dict() without sensitive data.
+        
+        Args:
+            query: Search query (matches nickname, display_name, full_name)
+            user_type: Filter by 'user' or 'org'
+            is_certified: Filter by certification status
+            limit: Maximum number of items read from DynamoDB
+            
+        Yields:
+            Matching UserOrg instances
+        """
+        read_model = cls._read_model()
+        query_lower = query.lower() if query else None
+        
+        if query_lower and len(query_lower) >= SEARCH_TOKEN_LENGTH and config.user_org_token_search:
+            # Probe the search token table, then hydrate candidates
+            items = cls._iter_token_candidates(read_model, query_lower, user_type, is_certified, limit)
+        
+        elif user_type:
+            # Query by user_type index
+            items = read_model.user_type_index.query(
+                user_type,
+                limit=limit,
+                scan_index_forward=False,
+                attributes_to_get=_PUBLIC_ATTRIBUTES
+            )
+        
+        elif is_certified is not None:
+            # Query by certified index
+            certified_value = 'true' if is_certified else 'false'
+            items = read_model.certified_index.query(
+                certified_value,
+                limit=limit,
+                scan_index_forward=False,
+                attributes_to_get=_PUBLIC_ATTRIBUTES
+            )
+        
+        else:
+            # Full table scan (limited)
+            items = read_model.scan(limit=limit, attributes_to_get=_PUBLIC_ATTRIBUTES)
+        
+        items = _mark_projected(items)
+        if not query:
+            yield from items
+            return
+        
+        # Apply text search filter (each field is lowercased at most once)
+        for entity in items:
+            full_name = entity.full_name
+            if (query_lower in entity.nickname.lower() or
+                    query_lower in entity.display_name.lower() or
+                    (full_name and query_lower in full_name.lower())):
+                yield entity
+    
+    @classmethod
+    def _iter_token_candidates(
+        cls,
+        read_model: type,
+        query_lower: str,
+        user_type: str = None,
+        is_certified: bool = None,
+        limit: int = 50
+    ) -> Iterator['UserOrg']:
+        """
+        Yield entities indexed under the query's leading search token
+        
+        Args:
+            read_model: Model class used for reads
+            query_lower: Lowercased search query
+            user_type: Filter by 'user' or 'org'
+            is_certified: Filter by certification status
+            limit: Maximum number of candidates read from DynamoDB
+            
+        Yields:
+            Candidate UserOrg instances (text match is applied by the caller)
+        """
+        certified_value = None if is_certified is None else ('true' if is_certified else 'false')
+        nicknames = islice(
+            UserOrgSearchToken.iter_nicknames(query_lower, page_size=min(limit, 100)),
+            limit
+        )
+        
+        # BatchGetItem accepts at most 100 keys per request
+        while chunk := list(islice(nicknames, 100)):
+            for entity in read_model.batch_get(chunk, attributes_to_get=_PUBLIC_ATTRIBUTES):
+                if user_type and entity.user_type != user_type:
+                    continue
+                if certified_value and entity.is_certified != certified_value:
+                    continue
+                yield entity
+    
+    @classmethod
+    def search_entities_iter(
+        cls,
+        query: str = None,
+        user_type: str = None,
+        is_certified: bool = None,
+        limit: int = 50
+    ) -> Iterator['UserOrg']:
+        """
+        Search entities with filters, streaming matches
         
         Args:
             query: Search query (matches nickname, display_name, full_name)
@@ -286,70 +529,90 @@ class UserOrg(Model):
             is_certified: Filter by certification status
             limit: Maximum number of results
             
-        Returns:
-            List of matching UserOrg instances
+        Yields:
+            Matching UserOrg instances
         """
         try:
-            results = []
-            
-            if user_type:
-                # Query by user_type index
-                query_obj = cls.user_type_index.query(
-                    user_type,
-                    limit=limit,
-                    scan_index_forward=False
-                )
-                results = list(query_obj)
-            
-            elif is_certified is not None:
-                # Query by certified index
-                certified_value = 'true' if is_certified else 'false'
-                query_obj = cls.certified_index.query(
-                    certified_value,
-                    limit=limit,
-                    scan_index_forward=False
-                )
-                results = list(query_obj)
-            
-            else:
-                # Full table scan (limited)
-                scan_obj = cls.scan(limit=limit)
-                results = list(scan_obj)
-            
-            # Apply text search filter if query provided
-            if query:
-                query_lower = query.lower()
-                results = [
-                    entity for entity in results
-                    if (query_lower in entity.nickname.lower() or
-                        query_lower in entity.display_name.lower() or
-                        (entity.full_name and query_lower in entity.full_name.lower()))
-                ]
+            yield from islice(cls._iter_entities(query, user_type, is_certified, limit), limit)
             
+        # Only database errors are translated; programming errors propagate
+        # with their original traceback
+        except (PynamoDBException, BotoCoreError, ClientError) as e:
             logger.log_database_operation(
                 table_name=cls.Meta.table_name,
                 operation='search',
-                success=True,
+                success=False,
                 query=query,
                 user_type=user_type,
                 is_certified=is_certified,
-                result_count=len(results)
-            )
-            
-            return results
-            
-        except (QueryError, Exception) as e:
-            logger.log_database_operation(
-                table_name=cls.Meta.table_name,
-                operation='search',
-                success=False,
-                query=query,
-                error=str(e)
+                error=str(e),
+                error_type=type(e).__name__
             )
             
             error_response = error_handler.handle_dynamodb_error(e, 'search_entities', cls.Meta.table_name)
             raise Exception(error_response['error_message'])
     
+    @classmethod
+    def search_entities(
+        cls, 
+        query: str = None,
+        user_type: str = None, 
+        is_certified: bool = None,
+        limit: int = 50
+    ) -> List['UserOrg']:
+        """
+        Search entities with filters
+        
+        Args:
+            query: Search query (matches nickname, display_name, full_name)
+            user_type: Filter by 'user' or 'org'
+            is_certified: Filter by certification status
+            limit: Maximum number of results
+            
+        Returns:
+            List of matching UserOrg instances
+        """
+        results = list(cls.search_entities_iter(query, user_type, is_certified, limit))
+        
+        logger.log_database_operation(
+            table_name=cls.Meta.table_name,
+            operation='search',
+            success=True,
+            query=query,
+            user_type=user_type,
+            is_certified=is_certified,
+            result_count=len(results)
+        )
+        
+        return results
+    
+    @classmethod
+    def iter_certified_entities(cls, limit: int = 50) -> Iterator[Dict[str, Any]]:
+        """
+        Stream certified entities as public dictionaries, most recent first
+        
+        Args:
+            limit: Maximum number of results
+            
+        Yields:
+            Public dictionary representation of each certified entity
+        """
+        for entity in cls.search_entities_iter(is_certified=True, limit=limit):
+            yield entity.to_dict()
+    
+    @classmethod
+    def get_certified_entities(cls, limit: int = 50) -> List[Dict[str, Any]]:
+        """
+        Get certified entities as public dictionaries, most recent first
+        
+        Args:
+            limit: Maximum number of results
+            
+        Returns:
+            List of public dictionary representations
+        """
+        return list(cls.iter_certified_entities(limit))
+    
     @classmethod 
     def get_by_type(cls, user_type: str, limit: int = 50) -> List['UserOrg']:
         """
@@ -362,11 +625,32 @@ class UserOrg(Model):
         Returns:
             List of UserOrg instances
         """
+        return cls.get_page_by_type(user_type, limit)['results']
+    
+    @classmethod
+    def get_page_by_type(
+        cls,
+        user_type: str,
+        limit: int = 50,
+        last_evaluated_key: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Get one page of entities by type
+        
+        Args:
+            user_type: 'user' or 'org'
+            limit: Maximum number of results
+            last_evaluated_key: Key returned by the previous page, passed back verbatim
+            
+        Returns:
+            Dict with 'results' and 'last_evaluated_key' (None on the last page)
+        """
         try:
-            query_obj = cls.user_type_index.query(
+            query_obj = cls._read_model().user_type_index.query(
                 user_type,
                 limit=limit,
-                scan_index_forward=False  # Most recent first
+                scan_index_forward=False,  # Most recent first
+                last_evaluated_key=last_evaluated_key
             )
             
             results = list(query_obj)
@@ -379,7 +663,11 @@ class UserOrg(Model):
                 result_count=len(results)
             )
             
-            return results
+            # Full composite key (table + index keys) of the last item returned
+            return {
+                'results': results,
+                'last_evaluated_key': query_obj.last_evaluated_key
+            }
             
         except (QueryError, Exception) as e:
             logger.log_database_operation(
@@ -393,6 +681,44 @@ class UserOrg(Model):
             error_response = error_handler.handle_dynamodb_error(e, 'get_by_type', cls.Meta.table_name)
             raise Exception(error_response['error_message'])
     
+    @classmethod
+    def rebuild_search_tokens(cls) -> int:
+        """
+        Backfill the search token table for entities saved before it existed
+        
+        Run once per environment before turning on USER_ORG_TOKEN_SEARCH;
+        text search keeps scanning the table until then.
+        Also deletes token rows left behind under nicknames that no longer
+        match an entity (e.g. rows written with a differently-cased key).
+        The expected token set of every entity is held in memory meanwhile.
+        
+        Returns:
+            Number of entities reindexed
+        """
+        reindexed = 0
+        expected = {}
+        for entity in cls.scan():
+            tokens = generate_search_tokens(entity.nickname, entity.display_name, entity.full_name)
+            expected[entity.nickname] = tokens
+            if tokens == (entity.search_tokens or set()):
+                continue
+            
+            UserOrgSearchToken.sync_tokens(entity.nickname, entity.search_tokens, tokens)
+            entity.update(actions=[cls.search_tokens.set(tokens) if tokens else cls.search_tokens.remove()])
+            reindexed += 1
+        
+        stale_count = UserOrgSearchToken.delete_stale(expected)
+        
+        logger.log_database_operation(
+            table_name=cls.Meta.table_name,
+            operation='rebuild_search_tokens',
+            success=True,
+            result_count=reindexed,
+            stale_token_count=stale_count
+        )
+        
+        return reindexed
+    
     def update_entity(self, updates: Dict[str, Any]) -> 'UserOrg':
         """
         Update entity attributes
@@ -408,9 +734,24 @@ class UserOrg(Model):
             if 'is_certified' in updates:
                 updates['is_certified'] = 'true' if updates['is_certified'] else 'false'
             
-            for key, value in updates.items():
-                if hasattr(self, key):
-                    setattr(self, key, value)
+            # Skip the write when nothing actually changes
+            effective = {
+                key: value for key, value in updates.items()
+                if hasattr(self, key) and getattr(self, key, _SENTINEL) != value
+            }
+            if not effective:
+                logger.log_database_operation(
+                    table_name=self.Meta.table_name,
+                    operation='update',
+                    success=True,
+                    nickname=self.nickname,
+                    updates=[],
+                    no_op=True
+                )
+                return self
+            
+            for key, value in effective.items():
+                setattr(self, key, value)
             
             self.save()
             
@@ -419,7 +760,49 @@ class UserOrg(Model):
                 operation='update',
                 success=True,
                 nickname=self.nickname,
-                updates=list(updates.keys())
+                updates=list(effective.keys())
+            )
+            
+            return self
+            
+        except (UpdateError, Exception) as e:
+            logger.log_database_operation(
+                table_name=self.Meta.table_name,
+                operation='update',
+                success=False,
+                nickname=self.nickname,
+                error=str(e)
+            )
+            
+            error_response = error_handler.handle_dynamodb_error(e, 'update_entity', self.Meta.table_name)
+            raise Exception(error_response['error_message'])
+    
+    def _set_field(self, name: str, value: Any) -> 'UserOrg':
+        """
+        Set a single attribute with a targeted UpdateItem instead of save()
+        
+        Args:
+            name: Attribute name
+            value: New value
+            
+        Returns:
+            Updated UserOrg instance
+        """
+        if getattr(self, name, _SENTINEL) == value:
+            return self
+        
+        try:
+            self.update(actions=[
+                getattr(UserOrg, name).set(value),
+                UserOrg.updated_at.set(datetime.now(timezone.utc))
+            ])
+            
+            logger.log_database_operation(
+                table_name=self.Meta.table_name,
+                operation='update',
+                success=True,
+                nickname=self.nickname,
+                updates=[name]
             )
             
             return self
@@ -443,7 +826,130 @@ class UserOrg(Model):
         Returns:
             Updated UserOrg instance
         """
-        return self.update_entity({'is_active': False})
+        return self._set_field('is_active', False)
+    
+    def set_certified(self, is_certified: bool) -> 'UserOrg':
+        """
+        Set certification status
+        
+        Args:
+            is_certified: New certification status
+            
+        Returns:
+            Updated UserOrg instance
+        """
+        return self._set_field('is_certified', 'true' if is_certified else 'false')
+    
+    @classmethod
+    def _bulk_set_field(cls, nicknames: List[str], name: str, value: Any) -> int:
+        """
+        Set one attribute on many entities using chunked write transactions
+        
+        Chunks are committed in order; a chunk that fails leaves the earlier
+        ones applied.
+        
+        Args:
+            nicknames: Entity nicknames
+            name: Attribute name
+            value: New value
+            
+        Returns:
+            Number of entities updated
+            
+        Raises:
+            ValueError: If a chunk names unknown nicknames (the message lists
+                them and how many entities were already updated)
+        """
+        nicknames = list(dict.fromkeys(nicknames))
+        attribute = getattr(cls, name)
+        now = datetime.now(timezone.utc)
+        connection = cls._get_connection().connection
+        applied = 0
+        
+        try:
+            for start in range(0, len(nicknames), _BULK_UPDATE_CHUNK_SIZE):
+                chunk = nicknames[start:start + _BULK_UPDATE_CHUNK_SIZE]
+                try:
+                    with TransactWrite(connection=connection) as transaction:
+                        for nickname in chunk:
+                            transaction.update(
+                                cls(nickname),
+                                actions=[attribute.set(value), cls.updated_at.set(now)],
+                                # Never create stub items for unknown nicknames
+                                condition=cls.nickname.exists()
+                            )
+                except TransactWriteError as e:
+                    unknown = [
+                        nickname.lower()
+                        for nickname, reason in zip(chunk, e.cancellation_reasons)
+                        if reason is not None and reason.code == 'ConditionalCheckFailed'
+                    ]
+                    if not unknown:
+                        raise
+                    raise ValueError(
+                        f"Unknown nicknames {unknown}; {applied} of {len(nicknames)} "
+                        "entities were updated before this chunk was rejected"
+                    ) from e
+                
+                # Invalidate only once the transaction has committed, so a
+                # concurrent lookup can't re-cache the pre-update item
+                for nickname in chunk:
+                    cls._invalidate_cached(nickname)
+                applied += len(chunk)
+            
+            logger.log_database_operation(
+                table_name=cls.Meta.table_name,
+                operation='bulk_update',
+                success=True,
+                updates=[name],
+                result_count=applied
+            )
+            
+            return applied
+            
+        except Exception as e:
+            logger.log_database_operation(
+                table_name=cls.Meta.table_name,
+                operation='bulk_update',
+                success=False,
+                updates=[name],
+                result_count=applied,
+                error=str(e)
+            )
+            
+            if isinstance(e, ValueError):
+                raise
+            
+            error_response = error_handler.handle_dynamodb_error(e, 'bulk_update', cls.Meta.table_name)
+            raise Exception(error_response['error_message'])
+    
+    @classmethod
+    def bulk_set_active(cls, nicknames: List[str], is_active: bool) -> int:
+        """
+        Activate or deactivate many entities
+        
+        Args:
+            nicknames: Entity nicknames
+            is_active: New active status
+            
+        Returns:
+            Number of entities updated
+        """
+        return cls._bulk_set_field(nicknames, 'is_active', is_active)
+    
+    @classmethod
+    def bulk_set_certified(cls, nicknames: List[str], is_certified: bool) -> int:
+        """
+        Set certification status on many entities
+        
+        Args:
+            nicknames: Entity nicknames
+            is_certified: New certification status
+            
+        Returns:
+            Number of entities updated
+        """
+        return cls._bulk_set_field(nicknames, 'is_certified', 'true' if is_certified else 'false')
     
     def delete_entity(self) -> bool:
         """
@@ -477,67 +983,89 @@ class UserOrg(Model):
             error_response = error_handler.handle_dynamodb_error(e, 'delete_entity', self.Meta.table_name)
             raise Exception(error_response['error_message'])
     
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Any attribute change (including save() touching updated_at and
+        # deserialization) invalidates the cached dict representation
+        object.__setattr__(self, '_dict_cache', None)
+        if name in _ISO_TIMESTAMP_FIELDS:
+            # Format once here so to_dict only copies the string
+            object.__setattr__(self, f'_{name}_iso', value.isoformat() if value else None)
+        super().__setattr__(name, value)
+    
     def to_dict(self, include_sensitive: bool = False) -> Dict[str, Any]:
         """
         Convert entity to dictionary representation
         
+        Built once per include_sensitive flag and cached until an attribute changes
+        
         Args:
             include_sensitive: Whether to include sensitive data (email, phone)
             
         Returns:
             Dictionary representation
         """
-        data = {
-            'nickname': self.nickname,
-            'user_type': self.user_type,
-            'entity_id': self.entity_id,
-            'display_name': self.display_name,
-            'full_name': self.full_name,
-            'bio': self.bio,
-            'location': self.location,
-            'country': self.country,
-            'website': self.website,
-            'profile_photo_url': self.profile_photo_url,
-            'banner_photo_url': self.banner_photo_url,
-            'is_active': self.is_active,
-            'is_verified': self.is_verified,
-            'is_certified': self.is_certified == 'true',
-            'social_links': self.social_links,
-            'tags': self.tags,
-            'stats': self.stats,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
-        }
-        
-        # User-specific fields
-        if self.user_type == 'user':
-            data.update({
-                'first_name': self.first_name,
-                'last_name': self.last_name,
-                'date_of_birth': self.date_of_birth
-            })
-        
-        # Organization-specific fields  
-        elif self.user_type == 'org':
-            data.update({
-                'org_type': self.org_type,
-                'founded_date': self.founded_date,
-                'employee_count': self.employee_count,
-                'industry': self.industry
-            })
+        cache = getattr(self, '_dict_cache', None)
+        if cache is None:
+            cache = {}
+            object.__setattr__(self, '_dict_cache', cache)
+        if include_sensitive not in cache:
+            cache[include_sensitive] = self._build_dict(include_sensitive)
+        return dict(cache[include_sensitive])
+    
+    def _build_dict(self, include_sensitive: bool) -> Dict[str, Any]:
+        """Build the dictionary representation returned by to_dict"""
+        data = dict(zip(_DICT_FIELDS, _get_dict_fields(self)))
+        data['is_certified'] = self.is_certified == 'true'
+        data.update(zip(_DICT_JSON_FIELDS, _get_dict_json_fields(self)))
+        data['created_at'] = getattr(self, '_created_at_iso', None)
+        data['updated_at'] = getattr(self, '_updated_at_iso', None)
+        
+        # Type-specific fields
+        type_fields = _DICT_TYPE_FIELDS.get(self.user_type)
+        if type_fields:
+            fields, getter = type_fields
+            data.update(zip(fields, getter(self)))
         
         # Sensitive information (only if requested)
         if include_sensitive:
-            data.update({
-                'email': self.email,
-                'phone': self.phone,
-                'timezone': self.timezone,
-                'privacy_settings': self.privacy_settings,
-                'metadata': self.metadata
-            })
+            data.update(zip(_DICT_SENSITIVE_FIELDS, _get_dict_sensitive_fields(self)))
         
         return data
-    
+
+    def to_json_bytes(self, include_sensitive: bool = False) -> bytes:
+        """
+        Serialize entity directly to JSON bytes for Lambda/API responses
+
+        Args:
+            include_sensitive: Whether to include sensitive data (email, phone)
+
+        Returns:
+            UTF-8 encoded JSON representation
+        """
+        return json_dumps_bytes(self.to_dict(include_sensitive=include_sensitive))
+
+    def to_public_bytes(self) -> bytes:
+        """
+        Serialize the public representation to a compact blob for caches
+
+        Returns:
+            MessagePack bytes (JSON bytes when msgpack is not installed)
+        """
+        return pack_bytes(self.to_dict())
+
+    @staticmethod
+    def from_public_bytes(blob: bytes) -> Dict[str, Any]:
+        """
+        Decode a blob produced by to_public_bytes
+
+        Args:
+            blob: Serialized public representation
+
+        Returns:
+            Public dictionary representation
+        """
+        return unpack_bytes(blob)
+
     def update_stats(self, stat_updates: Dict[str, Any]) -> 'UserOrg':
         """
         Update statistics
@@ -549,9 +1077,38 @@ class UserOrg(Model):
             Updated UserOrg instance
         """
         current_stats = self.stats or {}
-        current_stats.update(stat_updates)
+        new_stats = {**current_stats, **stat_updates}
+        if new_stats == current_stats:
+            return self
         
-        return self.update_entity({'stats': current_stats})
+        try:
+            # Targeted UpdateItem: only stats and updated_at are written
+            self.update(actions=[
+                UserOrg.stats.set(new_stats),
+                UserOrg.updated_at.set(datetime.now(timezone.utc))
+            ])
+            
+            logger.log_database_operation(
+                table_name=self.Meta.table_name,
+                operation='update_stats',
+                success=True,
+                nickname=self.nickname,
+                updates=list(stat_updates.keys())
+            )
+            
+            return self
+            
+        except (UpdateError, Exception) as e:
+            logger.log_database_operation(
+                table_name=self.Meta.table_name,
+                operation='update_stats',
+                success=False,
+                nickname=self.nickname,
+                error=str(e)
+            )
+            
+            error_response = error_handler.handle_dynamodb_error(e, 'update_stats', self.Meta.table_name)
+            raise Exception(error_response['error_message'])
     
     def add_tag(self, tag: str) -> 'UserOrg':
         """
@@ -565,8 +1122,7 @@ class UserOrg(Model):
         """
         current_tags = self.tags or []
         if tag not in current_tags:
-            current_tags.append(tag)
-            return self.update_entity({'tags': current_tags})
+            return self.update_entity({'tags': [*current_tags, tag]})
         return self
     
     def remove_tag(self, tag: str) -> 'UserOrg':
@@ -581,6 +1137,52 @@ class UserOrg(Model):
         """
         current_tags = self.tags or []
         if tag in current_tags:
-            current_tags.remove(tag)
-            return self.update_entity({'tags': current_tags})
-        return self
\ No newline at end of file
+            updated_tags = list(current_tags)
+            updated_tags.remove(tag)
+            return self.update_entity({'tags': updated_tags})
+        return self
+
+
+class UserOrgDAX(UserOrg):
+    """
+    UserOrg model bound to the DAX cluster
+
+    Returned by UserOrg read paths when DAX is enabled; DAX is write-through,
+    so saving an instance read through it still persists to DynamoDB
+    """
+
+    @classmethod
+    def _get_connection(cls):
+        """Swap the table connection's transport for the DAX cluster"""
+        if cls.__dict__.get('_connection') is None:
+            # Don't reuse the DynamoDB connection inherited from UserOrg
+            cls._connection = None
+            table_connection = super()._get_connection()
+            dax_connection = DAXConnection(
+                endpoint_url=config.dax_endpoint,
+                region=cls.Meta.region
+            )
+            dax_connection.add_meta_table(table_connection.get_meta_table())
+            table_connection.connection = dax_connection
+        return cls._connection
+
+
+def _mark_projected(items: Iterator[UserOrg]) -> Iterator[UserOrg]:
+    """Flag entities from projected reads so save/delete refuse them"""
+    for entity in items:
+        object.__setattr__(entity, '_projected', True)
+        yield entity
+
+
+def _get_raw_entity(model: type, nickname: str) -> Optional[Dict[str, Any]]:
+    """Fetch an entity's raw DynamoDB item, or None if it doesn't exist"""
+    try:
+        return model.get(nickname).serialize()
+    except DoesNotExist:
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _get_cached_raw_entity(model: type, nickname: str, ttl_bucket: int, generation: int) -> Optional[Dict[str, Any]]:
+    """Cached _get_raw_entity keyed by TTL bucket and write generation"""
+    return _get_raw_entity(model, nickname)
@@ -3,12 +3,37 @@ Image processing utilities using Pillow
 Handles resizing, optimization, and format conversion for photos
 """
 import io
-from typing import Dict, Tuple, Any, Optional
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Tuple, Any, Optional
 from PIL import Image, ImageOps, ImageFilter, ExifTags
 from ..constants import ImageConstants
 from ..logger import logger
 from ..config import config
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - only needed by the optional accelerated paths below
+    np = None
+
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB, TJSAMP_420
+    _turbo_jpeg = TurboJPEG()
+except (ImportError, OSError):  # pragma: no cover - install PyTurboJPEG (and libturbojpeg) to enable it
+    _turbo_jpeg = None
+
+try:
+    import cv2
+except ImportError:  # pragma: no cover - install opencv-python-headless to enable SIMD resizing
+    cv2 = None
+
+# EXIF Orientation tag id (0x0112), resolved once instead of per image
+_EXIF_ORIENTATION_TAG = int(ExifTags.Base.Orientation)
+
+# Input formats accepted without conversion and the default output format
+_ALLOWED_FORMATS = frozenset(ImageConstants.SUPPORTED_FORMATS)
+_OUTPUT_FORMAT = ImageConstants.JPEG
+
 
 class ImageProcessor:
     """
@@ -17,11 +42,24 @@ class ImageProcessor:
     
     def __init__(self):
         self.max_size = config.max_image_size
-        self.allowed_formats = ['JPEG', 'PNG', 'WEBP']
-        self.output_format = 'JPEG'
+        self.max_pixels = config.max_image_pixels
+        self.allowed_formats = _ALLOWED_FORMATS
+        self.output_format = _OUTPUT_FORMAT
         self.output_quality = ImageConstants.STANDARD_QUALITY
+        self.optimize_encoding = config.image_optimize_encoding
+        # Extra Huffman pass only where the byte savings matter
+        self.optimize_by_version = {'thumbnail': False, 'standard': False, 'high_res': True}
+        self.sharpen_thumbnails = config.image_sharpen_thumbnails
+        # Per-version output format overrides, e.g. {"thumbnail": "WEBP"}
+        self.format_by_version = {
+            version: output_format.upper()
+            for version, output_format in config.image_output_formats.items()
+            if output_format.upper() in (ImageConstants.JPEG, ImageConstants.WEBP)
+        }
     
-    def process_image(self, image_data: bytes, versions: Dict[str, Tuple[int, int]] = None) -> Dict[str, Any]:
+    def process_image(self, image_data: bytes, versions: Dict[str, Tuple[int, int]] = None,
+                      image: Optional[Image.Image] = None,
+                      on_version: Optional[Callable[[str, bytes, Dict[str, Any]], None]] = None) -> Dict[str, Any]:
         """
         Process image into multiple versions with square cropping
         
@@ -29,6 +67,9 @@ class ImageProcessor:
             image_data: Raw image bytes
             versions: Dictionary of version_name -> (width, height) tuples
                      Default: thumbnail (150x150), standard (320x320), high_res (800x800)
+            image: Image already opened from image_data (e.g. by validate_image_data)
+            on_version: Optional callback(version_name, data, stats) invoked as soon
+                        as each version is encoded, e.g. to start its upload early
         
         Returns:
             Dictionary containing processed image data for each version
@@ -42,19 +83,22 @@ class ImageProcessor:
         
         try:
             # Load and validate image
-            original_image = self._load_and_validate_image(image_data)
+            max_target = max(max(target_size) for target_size in versions.values()) if versions else None
+            original_image, original_size = self._load_and_validate_image(image_data, image, max_target)
             
             # Get original image info
-            original_size = original_image.size
             original_format = original_image.format
             original_mode = original_image.mode
             
-            logger.info("Image processing started", 
-                       original_size=original_size, 
-                       original_format=original_format,
-                       original_mode=original_mode,
-                       versions=list(versions.keys()))
+            if logger.info_enabled:
+                logger.info("Image processing started", 
+                           original_size=original_size, 
+                           original_format=original_format,
+                           original_mode=original_mode,
+                           versions=list(versions.keys()))
             
+            processed_versions = {}
+            processing_stats = {}
             results = {
                 'original_info': {
                     'size': original_size,
@@ -62,37 +106,78 @@ class ImageProcessor:
                     'mode': original_mode,
                     'file_size': len(image_data)
                 },
-                'versions': {},
-                'processing_stats': {}
+                'versions': processed_versions,
+                'processing_stats': processing_stats
             }
             
-            # Process each version
-            for version_name, target_size in versions.items():
-                try:
-                    processed_data, stats = self._process_version(original_image, target_size)
+            # Resize square versions from a single crop, largest first
+            square_images = self._resize_square_chain(
+                original_image,
+                [width for width, height in versions.values() if width == height]
+            )
+            
+            # Encode versions in parallel (Pillow releases the GIL while
+            # resizing and encoding)
+            max_workers = min(len(versions), os.cpu_count() or 1) or 1
+            optimize_encoding = self.optimize_encoding
+            optimize_for_version = self.optimize_by_version.get
+            format_for_version = self.format_by_version.get
+            completed = {}
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                submit = executor.submit
+                futures = {}
+                for version_name, target_size in versions.items():
+                    optimize = optimize_encoding and optimize_for_version(version_name, True)
+                    output_format = format_for_version(version_name, self.output_format)
+                    if target_size[0] == target_size[1]:
+                        future = submit(
+                            self._encode_image, square_images[target_size[0]], original_size, target_size,
+                            optimize, output_format
+                        )
+                    else:
+                        future = submit(
+                            self._process_version, original_image, target_size, optimize, output_format
+                        )
+                    futures[future] = version_name
+                
+                # Collect versions as they finish (smaller ones first)
+                for future in as_completed(futures):
+                    version_name = futures[future]
+                    target_size = versions[version_name]
+                    try:
+                        processed_data, stats = future.result()
+                    except Exception as e:
+                        logger.error("Failed to process image version", 
+                                   error=e, 
+                                   version=version_name,
+                                   target_size=target_size)
+                        # Continue processing other versions
+                        continue
                     
-                    results['versions'][version_name] = processed_data
-                    results['processing_stats'][version_name] = stats
+                    completed[version_name] = (processed_data, stats)
                     
-                    logger.debug(f"Version {version_name} processed successfully", 
-                                version=version_name, 
-                                target_size=target_size,
-                                output_size=stats['output_size'])
-                
-                except Exception as e:
-                    logger.error(f"Failed to process version {version_name}", 
-                               error=e, 
-                               version=version_name,
-                               target_size=target_size)
-                    # Continue processing other versions
-                    continue
+                    if logger.debug_enabled:
+                        logger.debug("Image version processed successfully", 
+                                    version=version_name, 
+                                    target_size=target_size,
+                                    output_size=stats['output_size'])
+                    
+                    if on_version is not None:
+                        on_version(version_name, processed_data, stats)
             
-            if not results['versions']:
+            # Results keep the requested version order
+            for version_name in versions:
+                if version_name in completed:
+                    processed_versions[version_name], processing_stats[version_name] = completed[version_name]
+            
+            if not processed_versions:
                 raise ValueError("No image versions could be processed")
             
+            results['total_reduction'] = self._calculate_total_reduction(results)
+            
             logger.info("Image processing completed", 
-                       versions_created=len(results['versions']),
-                       total_reduction=self._calculate_total_reduction(results))
+                       versions_created=len(processed_versions),
+                       total_reduction=results['total_reduction'])
             
             return results
         
@@ -100,15 +185,19 @@ class ImageProcessor:
             logger.error("Image processing failed", error=e)
             raise ValueError(f"Image processing failed: {str(e)}")
     
-    def _load_and_validate_image(self, image_data: bytes) -> Image.Image:
+    def _load_and_validate_image(self, image_data: bytes, image: Optional[Image.Image] = None,
+                                 max_target: Optional[int] = None) -> Tuple[Image.Image, Tuple[int, int]]:
         """
         Load image from bytes and perform validation
         
         Args:
             image_data: Raw image bytes
+            image: Image already opened from image_data (skips re-parsing the header)
+            max_target: Largest requested output dimension, used to decode
+                        JPEGs at a reduced scale
         
         Returns:
-            PIL Image object
+            Tuple of (PIL Image object, original upright (width, height))
         
         Raises:
             ValueError: If image is invalid or unsupported
@@ -116,32 +205,49 @@ class ImageProcessor:
         if len(image_data) > self.max_size:
             raise ValueError(f"Image too large: {len(image_data)} bytes (max: {self.max_size})")
         
-        try:
-            image = Image.open(io.BytesIO(image_data))
-        except Exception as e:
-            raise ValueError(f"Invalid image data: {str(e)}")
+        if image is None:
+            try:
+                image = Image.open(io.BytesIO(image_data))
+            except Exception as e:
+                raise ValueError(f"Invalid image data: {str(e)}")
         
         # Validate format
         if image.format not in self.allowed_formats:
             logger.warning("Unsupported image format, converting", 
                           original_format=image.format,
-                          supported_formats=self.allowed_formats)
+                          supported_formats=sorted(self.allowed_formats))
+        
+        # Decompression bomb guard: reject from the header, before decoding
+        width, height = image.size
+        if width * height > self.max_pixels:
+            raise ValueError(f"Image too large: {width}x{height} pixels (max: {self.max_pixels})")
+        
+        # Let libjpeg decode at 1/2, 1/4 or 1/8 scale when the largest version
+        # is much smaller than the source. This drops pixels the LANCZOS resize
+        # would discard anyway and keeps at least 2x the target resolution.
+        original_size = image.size
+        if max_target and image.format == 'JPEG':
+            image.draft(image.mode, (max_target * 2, max_target * 2))
+        
+        # Decode now and release the encoded stream so only the pixel buffer
+        # stays alive (versions also read the image concurrently afterwards)
+        image.load()
+        if image.fp is not None:
+            image.fp.close()
         
         # Auto-rotate based on EXIF orientation
+        if image.getexif().get(_EXIF_ORIENTATION_TAG) in (5, 6, 7, 8):
+            original_size = original_size[::-1]
         image = self._auto_rotate_image(image)
         
-        # Convert to RGB if needed (for JPEG output)
-        if image.mode in ('RGBA', 'P', 'L', 'LA'):
-            # Handle transparency by adding white background
-            background = Image.new('RGB', image.size, (255, 255, 255))
-            if image.mode == 'P':
-                image = image.convert('RGBA')
-            background.paste(image, mask=image.split()[-1] if image.mode in ('RGBA', 'LA') else None)
-            image = background
-        elif image.mode != 'RGB':
+        # Convert to RGB if needed (for JPEG output); transparent images stay
+        # RGBA and are flattened onto white after the square crop
+        if image.mode in ('P', 'PA', 'LA'):
+            image = image.convert('RGBA')
+        elif image.mode not in ('RGB', 'RGBA'):
             image = image.convert('RGB')
         
-        return image
+        return image, original_size
     
     def _auto_rotate_image(self, image: Image.Image) -> Image.Image:
         """
@@ -154,42 +260,25 @@ class ImageProcessor:
             Rotated image
         """
         try:
-            # Get EXIF data
-            exif = image._getexif()
-            if exif is not None:
-                # Find orientation tag
-                orientation_key = None
-                for tag, value in ExifTags.TAGS.items():
-                    if value == 'Orientation':
-                        orientation_key = tag
-                        break
-                
-                if orientation_key and orientation_key in exif:
-                    orientation = exif[orientation_key]
-                    
-                    # Apply rotation based on orientation
-                    if orientation == 3:
-                        image = image.rotate(180, expand=True)
-                    elif orientation == 6:
-                        image = image.rotate(270, expand=True)
-                    elif orientation == 8:
-                        image = image.rotate(90, expand=True)
-                    
-                    logger.debug("Image auto-rotated based on EXIF", orientation=orientation)
-        
-        except (AttributeError, KeyError, TypeError):
-            # No EXIF data or orientation info
+            # Handles all 8 orientations (including mirrored ones); in place
+            # so unrotated images are not copied and keep their format info
+            ImageOps.exif_transpose(image, in_place=True)
+        except (AttributeError, KeyError, TypeError, ValueError, OSError):
+            # No EXIF data or unreadable orientation info
             pass
         
         return image
     
-    def _process_version(self, image: Image.Image, target_size: Tuple[int, int]) -> Tuple[bytes, Dict[str, Any]]:
+    def _process_version(self, image: Image.Image, target_size: Tuple[int, int],
+                         optimize: bool = True, output_format: Optional[str] = None) -> Tuple[bytes, Dict[str, Any]]:
         """
         Process single image version with square cropping and optimization
         
         Args:
             image: Original PIL Image
             target_size: Target (width, height) tuple
+            optimize: Whether to run the extra Huffman optimization pass
+            output_format: Output format (defaults to self.output_format)
         
         Returns:
             Tuple of (processed_image_bytes, processing_stats)
@@ -199,29 +288,143 @@ class ImageProcessor:
         # Create square crop (Instagram-style)
         processed_image = self._create_square_crop(image, target_width)
         
-        # Apply optimization
-        processed_image = self._optimize_image(processed_image)
+        return self._encode_image(processed_image, image.size, target_size, optimize, output_format)
+    
+    def _output_quality(self, output_format: str) -> int:
+        """Get encoder quality for the output format"""
+        return ImageConstants.WEBP_QUALITY if output_format == ImageConstants.WEBP else self.output_quality
+    
+    def _save_image(self, image: Image.Image, optimize: bool = True, output_format: Optional[str] = None) -> bytes:
+        """
+        Encode image in the output format
+        
+        JPEG uses libjpeg-turbo directly when available and the extra Huffman
+        optimization pass is disabled; otherwise falls back to Pillow.
+        
+        Args:
+            image: PIL Image object (RGB)
+            optimize: Whether to run the extra Huffman optimization pass (JPEG)
+            output_format: Output format (defaults to self.output_format)
+        
+        Returns:
+            Encoded image bytes
+        """
+        output_format = output_format or self.output_format
+        if output_format == ImageConstants.WEBP:
+            save_params = {'quality': ImageConstants.WEBP_QUALITY, 'method': 4}
+        elif _turbo_jpeg is not None and output_format == ImageConstants.JPEG and not optimize:
+            return _turbo_jpeg.encode(
+                np.asarray(image),
+                quality=self.output_quality,
+                pixel_format=TJPF_RGB,
+                jpeg_subsample=TJSAMP_420
+            )
+        else:
+            save_params = {'quality': self.output_quality, 'optimize': optimize}
         
-        # Convert to bytes
         output_buffer = io.BytesIO()
-        processed_image.save(
-            output_buffer, 
-            format=self.output_format, 
-            quality=self.output_quality,
-            optimize=True
-        )
+        image.save(output_buffer, format=output_format, **save_params)
+        return output_buffer.getvalue()
+    
+    def _resize_square_chain(self, image: Image.Image, sizes: List[int]) -> Dict[int, Image.Image]:
+        """
+        Resize a single center crop to each square size, largest first
         
-        processed_bytes = output_buffer.getvalue()
+        Smaller sizes are downsampled from the previous (already small) version
+        instead of from the full-resolution original.
+        
+        Args:
+            image: Original PIL Image
+            sizes: Target square sizes
+        
+        Returns:
+            Dictionary of size -> resized square image
+        """
+        if not sizes:
+            return {}
+        
+        if cv2 is not None and image.mode == 'RGB':
+            return self._resize_square_chain_cv(np.asarray(image), sizes)
+        
+        square_image = self._flatten_alpha(self._crop_to_square(image))
+        source = square_image
+        resized = {}
+        
+        for size in sorted(set(sizes), reverse=True):
+            resized[size] = self._resize_square(source, size)
+            # Only chain from downscaled versions; upscales resize from the crop
+            if size <= square_image.size[0]:
+                source = resized[size]
+        
+        return resized
+    
+    def _resize_square_chain_cv(self, pixels: Any, sizes: List[int]) -> Dict[int, Image.Image]:
+        """
+        OpenCV variant of _resize_square_chain working on a single array
+        
+        The image is converted to NumPy once; the center crop is a slice view
+        and every resize stays in NumPy until the final versions are wrapped
+        back into PIL images for encoding.
+        
+        Args:
+            pixels: Original image as an RGB (height, width, 3) array
+            sizes: Target square sizes
+        
+        Returns:
+            Dictionary of size -> resized square image
+        """
+        height, width = pixels.shape[:2]
+        side = min(width, height)
+        top = (height - side) // 2
+        left = (width - side) // 2
+        source = square = pixels[top:top + side, left:left + side]
+        resized = {}
+        
+        for size in sorted(set(sizes), reverse=True):
+            if size == source.shape[0]:
+                output = source
+            else:
+                interpolation = cv2.INTER_AREA if size < source.shape[0] else cv2.INTER_LANCZOS4
+                output = cv2.resize(source, (size, size), interpolation=interpolation)
+            resized[size] = Image.fromarray(output)
+            # Only chain from downscaled versions; upscales resize from the crop
+            if size <= square.shape[0]:
+                source = output
+        
+        return resized
+    
+    def _encode_image(self, image: Image.Image, input_size: Tuple[int, int], target_size: Tuple[int, int],
+                      optimize: bool = True, output_format: Optional[str] = None) -> Tuple[bytes, Dict[str, Any]]:
+        """
+        Optimize and encode a resized version
+        
+        Args:
+            image: Resized PIL Image
+            input_size: Size of the original image
+            target_size: Target (width, height) tuple
+            optimize: Whether to run the extra Huffman optimization pass
+            output_format: Output format (defaults to self.output_format)
+        
+        Returns:
+            Tuple of (processed_image_bytes, processing_stats)
+        """
+        # Apply optimization
+        processed_image = self._optimize_image(image)
+        
+        # Convert to bytes
+        output_format = output_format or self.output_format
+        processed_bytes = self._save_image(processed_image, optimize, output_format)
+        file_size = len(processed_bytes)
         
         # Calculate statistics
         stats = {
-            'input_size': image.size,
+            'input_size': input_size,
             'output_size': processed_image.size,
             'target_size': target_size,
-            'file_size': len(processed_bytes),
-            'compression_ratio': len(processed_bytes) / (image.size[0] * image.size[1] * 3),  # Rough estimate
-            'format': self.output_format,
-            'quality': self.output_quality
+            'file_size': file_size,
+            'compression_ratio': file_size / (input_size[0] * input_size[1] * 3),  # Rough estimate
+            'format': output_format,
+            'quality': self._output_quality(output_format)
         }
         
         return processed_bytes, stats
@@ -237,7 +440,52 @@ class ImageProcessor:
         Returns:
             Square cropped and resized image
         """
+        # Resize to target size with high-quality resampling
+        return self._resize_square(self._flatten_alpha(self._crop_to_square(image)), target_size)
+    
+    def _resize_square(self, image: Image.Image, target_size: int) -> Image.Image:
+        """
+        Resize square image with high-quality resampling
+        
+        Uses OpenCV's SIMD kernels when available (INTER_AREA when shrinking,
+        INTER_LANCZOS4 when enlarging); otherwise Pillow's LANCZOS.
+        
+        Args:
+            image: Square PIL Image object (RGB)
+            target_size: Target square size (width = height)
+        
+        Returns:
+            Resized image
+        """
+        if target_size == image.size[0]:
+            return image
+        
+        if cv2 is not None and image.mode == 'RGB':
+            interpolation = cv2.INTER_AREA if target_size < image.size[0] else cv2.INTER_LANCZOS4
+            resized = cv2.resize(np.asarray(image), (target_size, target_size), interpolation=interpolation)
+            return Image.fromarray(resized)
+        
+        # Large upscales look the same with the cheaper BICUBIC filter
+        if target_size >= image.size[0] * 2:
+            return image.resize((target_size, target_size), Image.Resampling.BICUBIC)
+        
+        # For large downscales, box-reduce by an integer factor first and leave
+        # at least a 3x LANCZOS pass (visually indistinguishable, much cheaper)
+        return image.resize((target_size, target_size), Image.Resampling.LANCZOS, reducing_gap=3.0)
+    
+    def _crop_to_square(self, image: Image.Image) -> Image.Image:
+        """
+        Center crop image to a square (Instagram-style)
+        
+        Args:
+            image: PIL Image object
+        
+        Returns:
+            Square cropped image
+        """
         width, height = image.size
+        if width == height:
+            return image
         
         # Determine crop area for square (center crop)
         if width > height:
@@ -254,15 +502,23 @@ class ImageProcessor:
             bottom = top + width
         
         # Crop to square
-        square_image = image.crop((left, top, right, bottom))
+        return image.crop((left, top, right, bottom))
+    
+    def _flatten_alpha(self, image: Image.Image) -> Image.Image:
+        """
+        Flatten transparency onto a white background
         
-        # Resize to target size with high-quality resampling
-        resized_image = square_image.resize(
-            (target_size, target_size), 
-            Image.Resampling.LANCZOS
-        )
+        Args:
+            image: PIL Image object
+        
+        Returns:
+            RGB image
+        """
+        if image.mode != 'RGBA':
+            return image
         
-        return resized_image
+        background = Image.new('RGBA', image.size, (255, 255, 255, 255))
+        return Image.alpha_composite(background, image).convert('RGB')
     
     def _optimize_image(self, image: Image.Image) -> Image.Image:
         """
@@ -274,11 +530,16 @@ class ImageProcessor:
         Returns:
             Optimized image
         """
-        # Apply slight sharpening for small images (thumbnails)
-        if image.size[0] <= 150:
-            image = image.filter(ImageFilter.UnsharpMask(radius=0.5, percent=50, threshold=0))
+        # Apply slight sharpening for small images (thumbnails), opt-in
+        if not self.sharpen_thumbnails or image.size[0] > 150:
+            return image
         
-        return image
+        if cv2 is not None and image.mode == 'RGB':
+            pixels = np.asarray(image)
+            blurred = cv2.GaussianBlur(pixels, (0, 0), 0.5)
+            return Image.fromarray(cv2.addWeighted(pixels, 1.5, blurred, -0.5, 0))
+        
+        return image.filter(ImageFilter.UnsharpMask(radius=0.5, percent=50, threshold=0))
     
     def _calculate_total_reduction(self, results: Dict[str, Any]) -> str:
         """
@@ -314,7 +575,8 @@ class ImageProcessor:
             image_data: Raw image bytes
         
         Returns:
-            Validation result with image info
+            Validation result with image info (and the opened 'image', which
+            can be passed to process_image to avoid parsing the data again)
         """
         try:
             image = Image.open(io.BytesIO(image_data))
@@ -325,7 +587,8 @@ class ImageProcessor:
                 'size': image.size,
                 'mode': image.mode,
                 'file_size': len(image_data),
-                'within_size_limit': len(image_data) <= self.max_size
+                'within_size_limit': len(image_data) <= self.max_size,
+                'image': image
             }
         
         except Exception as e:
@@ -340,19 +603,26 @@ class ImageProcessor:
 # Global image processor instance
 image_processor = ImageProcessor()
 
+# Make Pillow's own bomb check (raised at 2x this limit) match the service limit
+Image.MAX_IMAGE_PIXELS = image_processor.max_pixels
+
 
-def process_image(image_data: bytes, versions: Dict[str, Tuple[int, int]] = None) -> Dict[str, Any]:
+def process_image(image_data: bytes, versions: Dict[str, Tuple[int, int]] = None,
+                  image: Optional[Image.Image] = None,
+                  on_version: Optional[Callable[[str, bytes, Dict[str, Any]], None]] = None) -> Dict[str, Any]:
     """
     Process image data into multiple versions
     
     Args:
         image_data: Raw image bytes
         versions: Optional version specifications
+        image: Optional image already opened from image_data
+        on_version: Optional callback invoked as each version is encoded
     
     Returns:
         Processing results
     """
-    return image_processor.process_image(image_data, versions)
+    return image_processor.process_image(image_data, versions, image, on_version)
 
 
 def validate_image(image_data: bytes) -> Dict[str, Any]:
@@ -2,6 +2,9 @@
 Photo service with complete upload/delete/refresh operations
 Handles photo processing, S3 storage, and database operations
 """
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timezone
 from ..constants import ImageConstants
@@ -13,9 +16,24 @@ from ..processors.image import image_processor
 from ..models.photo import Photo
 from ..utils import (
     generate_s3_key, upload_to_s3, delete_s3_objects, 
-    generate_presigned_url, generate_public_url
+    generate_presigned_url, generate_public_url, get_s3_client
 )
 
+# One upload thread per default image version
+UPLOAD_MAX_WORKERS = 3
+
+# Upper bound on threads signing URLs during bulk refresh
+REFRESH_MAX_WORKERS = 16
+
+# Presigned URLs kept for repeated photo info reads
+PRESIGNED_URL_CACHE_SIZE = 10_000
+
+# Photo attributes read when refreshing URLs
+REFRESH_ATTRIBUTES = [
+    'photo_id', 'entity_type', 'entity_id', 'photo_type', 'bucket_name',
+    'thumbnail_url', 'standard_key', 'high_res_key'
+]
+
 
 class PhotoService:
     """
@@ -23,9 +41,32 @@ class PhotoService:
     Handles upload, processing, storage, and cleanup
     """
     
-    def __init__(self):
-        self.bucket_name = config.photo_bucket_name
+    # Configuration shared by all instances, resolved on first use
+    _config_loaded = False
+    _default_bucket_name = None
+    _default_presigned_url_expiry = None
+    
+    def __init__(self, bucket_name: Optional[str] = None, presigned_url_expiry: Optional[int] = None):
+        self._load_config()
+        self.bucket_name = bucket_name or self._default_bucket_name
+        self.presigned_url_expiry = presigned_url_expiry or self._default_presigned_url_expiry
         self.image_processor = image_processor
+        self._s3_client = None
+    
+    @classmethod
+    def _load_config(cls):
+        """Resolve configuration once per process instead of once per instance"""
+        if not cls._config_loaded:
+            cls._default_bucket_name = config.photo_bucket_name
+            cls._default_presigned_url_expiry = config.presigned_url_expiry
+            cls._config_loaded = True
+    
+    @property
+    def s3_client(self):
+        """Lazy initialization of S3 client (shared by upload threads)"""
+        if self._s3_client is None:
+            self._s3_client = get_s3_client()
+        return self._s3_client
     
     def upload_photo(
         self,
@@ -65,29 +106,54 @@ class PhotoService:
             photo_id = generate_photo_id()
             
             # Parse and validate image data
-            image_bytes = parse_base64_image(image_data)
-            logger.info("Image data parsed", 
-                       photo_id=photo_id,
-                       image_size=len(image_bytes))
-            
-            # Process image into multiple versions
-            processing_result = self.image_processor.process_image(image_bytes)
-            logger.info("Image processing completed", 
-                       photo_id=photo_id,
-                       versions=list(processing_result['versions'].keys()))
-            
-            # Upload all versions to S3
-            upload_results = self._upload_versions_to_s3(
-                processing_result['versions'],
-                entity_type,
-                entity_id, 
-                photo_type,
-                photo_id
-            )
+            _, image_bytes = parse_base64_image(image_data)
+            if logger.info_enabled:
+                logger.info("Image data parsed", 
+                           photo_id=photo_id,
+                           image_size=len(image_bytes))
+            
+            # Process image into multiple versions, starting each version's
+            # S3 upload as soon as it is encoded so uploads overlap encoding
+            uploads = {}
+            with ThreadPoolExecutor(max_workers=UPLOAD_MAX_WORKERS) as upload_executor:
+                # Look up the photos to clean up while the image is processed,
+                # keeping the query off the critical path
+                if cleanup_old:
+                    existing_photos = upload_executor.submit(
+                        self._get_cleanup_candidates, entity_type, entity_id, photo_type
+                    )
+                
+                def start_upload(version_name: str, version_bytes: bytes, stats: Dict[str, Any]):
+                    # Versions finish smallest first; stop uploading once one failed
+                    if self._upload_failed(uploads):
+                        return
+                    uploads[version_name] = self._start_version_upload(
+                        upload_executor, version_name, version_bytes,
+                        entity_type, entity_id, photo_type, stats['format']
+                    )
+                
+                processing_result = self.image_processor.process_image(
+                    image_bytes, on_version=start_upload
+                )
+                if logger.info_enabled:
+                    logger.info("Image processing completed", 
+                               photo_id=photo_id,
+                               versions=list(processing_result['versions'].keys()))
+                
+                # Wait for all S3 uploads while the executor is still open, so
+                # queued uploads can be cancelled once one version failed
+                upload_results = self._collect_version_uploads(
+                    uploads, processing_result['versions'], photo_id
+                )
             
             # Generate URLs
             urls = self._generate_photo_urls(upload_results)
             
+            processed_sizes = {
+                version: stats['file_size']
+                for version, stats in processing_result['processing_stats'].items()
+            }
+            
             # Create database record
             photo_record = self._create_photo_record(
                 photo_id=photo_id,
@@ -98,14 +164,16 @@ class PhotoService:
                 urls=urls,
                 processing_result=processing_result,
                 uploaded_by=uploaded_by,
-                upload_source=upload_source
+                upload_source=upload_source,
+                processed_sizes=processed_sizes
             )
             
             # Clean up old photos if requested
             cleanup_result = {}
             if cleanup_old:
                 cleanup_result = self._cleanup_old_photos(
-                    entity_type, entity_id, photo_type, keep_count=1
+                    entity_type, entity_id, photo_type, keep_count=1,
+                    existing_photos=existing_photos.result()
                 )
             
             result = {
@@ -116,10 +184,7 @@ class PhotoService:
                 'urls': urls,
                 'metadata': {
                     'original_size': processing_result['original_info']['file_size'],
-                    'processed_sizes': {
-                        version: stats['file_size'] 
-                        for version, stats in processing_result['processing_stats'].items()
-                    },
+                    'processed_sizes': processed_sizes,
                     'processing_stats': processing_result['processing_stats'],
                     'total_reduction': processing_result.get('total_reduction', '0%')
                 },
@@ -186,7 +251,7 @@ class PhotoService:
             
             elif entity_type and entity_id:
                 # Bulk deletion by entity
-                photos_to_delete = Photo.get_entity_photos(
+                photos_to_delete = Photo.get_entity_photo_keys(
                     entity_type, entity_id, photo_type
                 )
                 if not photos_to_delete:
@@ -204,55 +269,24 @@ class PhotoService:
             else:
                 raise ValueError("Must provide either photo_id or entity_type/entity_id")
             
-            # Delete photos
-            deletion_results = []
-            s3_keys_to_delete = []
-            
-            for photo in photos_to_delete:
-                # Collect S3 keys
-                photo_s3_keys = [
-                    photo.thumbnail_key,
-                    photo.standard_key,
-                    photo.high_res_key
-                ]
-                s3_keys_to_delete.extend([key for key in photo_s3_keys if key])
-                
-                # Delete database record
-                try:
-                    photo.delete_photo()
-                    deletion_results.append({
-                        'photo_id': photo.photo_id,
-                        'success': True
-                    })
-                except Exception as e:
-                    deletion_results.append({
-                        'photo_id': photo.photo_id,
-                        'success': False,
-                        'error': str(e)
-                    })
-                    logger.error("Failed to delete photo record", 
-                               error=e,
-                               photo_id=photo.photo_id)
-            
-            # Delete S3 objects in batch
-            s3_deletion_result = delete_s3_objects(self.bucket_name, s3_keys_to_delete)
+            # Delete database records and S3 objects
+            deleted_photo_ids, failed_deletions, s3_deletion_result = self._delete_photos_and_objects(
+                photos_to_delete
+            )
             
             # Summary
-            successful_deletions = [r for r in deletion_results if r['success']]
-            failed_deletions = [r for r in deletion_results if not r['success']]
-            
             result = {
                 'success': len(failed_deletions) == 0,
-                'deleted_count': len(successful_deletions),
+                'deleted_count': len(deleted_photo_ids),
                 'failed_count': len(failed_deletions),
-                'deleted_photos': [r['photo_id'] for r in successful_deletions],
+                'deleted_photos': deleted_photo_ids,
                 'failed_photos': [r['photo_id'] for r in failed_deletions],
                 's3_cleanup': s3_deletion_result
             }
             
             logger.log_service_operation(
                 "photo_delete_complete",
-                deleted_count=len(successful_deletions),
+                deleted_count=len(deleted_photo_ids),
                 failed_count=len(failed_deletions),
                 s3_deleted=s3_deletion_result.get('deleted_count', 0)
             )
@@ -309,7 +343,9 @@ class PhotoService:
             
             elif entity_type and entity_id:
                 # Bulk refresh by entity
-                photos = Photo.get_entity_photos(entity_type, entity_id, photo_type)
+                photos = Photo.get_entity_photos(
+                    entity_type, entity_id, photo_type, attributes_to_get=REFRESH_ATTRIBUTES
+                )
                 if not photos:
                     return {
                         'success': True,
@@ -321,36 +357,18 @@ class PhotoService:
             else:
                 raise ValueError("Must provide either photo_id or entity_type/entity_id")
             
-            # Refresh URLs for each photo
-            refreshed_photos = []
-            expiry = expiry_seconds or config.presigned_url_expiry
+            # Refresh URLs for each photo (one client signs every URL)
+            expiry = expiry_seconds or self.presigned_url_expiry
+            s3_client = self.s3_client
             
-            for photo in photos:
-                urls = {
-                    'thumbnail_url': photo.thumbnail_url,  # Already public
-                    'standard_url': None,
-                    'high_res_url': None
-                }
-                
-                # Generate new presigned URLs
-                if photo.standard_key:
-                    urls['standard_url'] = generate_presigned_url(
-                        photo.bucket_name, photo.standard_key, expiry
-                    )
-                
-                if photo.high_res_key:
-                    urls['high_res_url'] = generate_presigned_url(
-                        photo.bucket_name, photo.high_res_key, expiry
-                    )
-                
-                refreshed_photos.append({
-                    'photo_id': photo.photo_id,
-                    'entity_type': photo.entity_type,
-                    'entity_id': photo.entity_id,
-                    'photo_type': photo.photo_type,
-                    'urls': urls,
-                    'expires_at': datetime.now(timezone.utc).timestamp() + expiry
-                })
+            if len(photos) == 1:
+                refreshed_photos = [self._refresh_photo(photos[0], expiry, s3_client)]
+            else:
+                # Photos are signed independently; map keeps the query order
+                with ThreadPoolExecutor(max_workers=min(REFRESH_MAX_WORKERS, len(photos))) as executor:
+                    refreshed_photos = list(executor.map(
+                        lambda photo: self._refresh_photo(photo, expiry, s3_client), photos
+                    ))
             
             result = {
                 'success': True,
@@ -375,6 +393,44 @@ class PhotoService:
                         entity_id=entity_id)
             raise
     
+    def _refresh_photo(self, photo: Photo, expiry: int, s3_client) -> Dict[str, Any]:
+        """
+        Generate fresh URLs for a single photo
+        
+        Args:
+            photo: Photo record
+            expiry: URL expiry in seconds
+            s3_client: S3 client used for signing
+            
+        Returns:
+            Refreshed photo entry
+        """
+        urls = {
+            'thumbnail_url': photo.thumbnail_url,  # Already public
+            'standard_url': None,
+            'high_res_url': None
+        }
+        
+        # Generate new presigned URLs
+        if photo.standard_key:
+            urls['standard_url'] = generate_presigned_url(
+                photo.bucket_name, photo.standard_key, expiry, s3_client
+            )
+        
+        if photo.high_res_key:
+            urls['high_res_url'] = generate_presigned_url(
+                photo.bucket_name, photo.high_res_key, expiry, s3_client
+            )
+        
+        return {
+            'photo_id': photo.photo_id,
+            'entity_type': photo.entity_type,
+            'entity_id': photo.entity_id,
+            'photo_type': photo.photo_type,
+            'urls': urls,
+            'expires_at': datetime.now(timezone.utc).timestamp() + expiry
+        }
+    
     def get_photo_info(self, photo_id: str) -> Dict[str, Any]:
         """
         Get comprehensive photo information
@@ -390,28 +446,110 @@ class PhotoService:
             if not photo:
                 raise ValueError(f"Photo with ID '{photo_id}' not found")
             
-            return photo.to_dict(include_presigned_urls=True)
+            data = photo.to_dict()
+            
+            # Repeated reads of a photo reuse recently signed URLs
+            data['standard_url'] = self._get_cached_presigned_url(
+                photo.bucket_name, photo.standard_key
+            ) if photo.standard_key else None
+            
+            data['high_res_url'] = self._get_cached_presigned_url(
+                photo.bucket_name, photo.high_res_key
+            ) if photo.high_res_key else None
+            
+            return data
             
         except Exception as e:
             logger.error("Failed to get photo info", error=e, photo_id=photo_id)
             raise
     
-    def _upload_versions_to_s3(
+    def _get_cached_presigned_url(self, bucket_name: str, s3_key: str) -> Optional[str]:
+        """
+        Get a presigned URL, reusing one signed within the last half expiry
+        
+        Cached URLs therefore stay valid for at least half the configured expiry.
+        
+        Args:
+            bucket_name: S3 bucket name
+            s3_key: S3 object key
+            
+        Returns:
+            Presigned URL or None if generation failed
+        """
+        expiry = self.presigned_url_expiry
+        ttl = max(expiry // 2, 1)
+        try:
+            return _get_cached_presigned_url(
+                self.s3_client, bucket_name, s3_key, expiry, int(time.monotonic() // ttl)
+            )
+        except ValueError:
+            return None
+    
+    def _start_version_upload(
         self,
-        versions: Dict[str, bytes],
+        executor: ThreadPoolExecutor,
+        version_name: str,
+        image_bytes: bytes,
         entity_type: str,
         entity_id: str,
         photo_type: str,
-        photo_id: str
-    ) -> Dict[str, Any]:
+        image_format: str = ImageConstants.JPEG
+    ) -> Tuple[str, Any]:
         """
-        Upload all image versions to S3
+        Submit the S3 upload of one image version
         
         Args:
-            versions: Dictionary of version_name -> image_bytes
+            executor: Executor running the upload
+            version_name: Image version name
+            image_bytes: Encoded image bytes
             entity_type: Entity type
             entity_id: Entity ID
             photo_type: Photo type
+            image_format: Image format of the version
+            
+        Returns:
+            Tuple of (s3_key, upload future)
+        """
+        # Generate S3 key
+        s3_key = generate_s3_key(
+            entity_type, entity_id, photo_type, version_name,
+            ImageConstants.FILE_EXTENSIONS[image_format]
+        )
+        
+        # Upload to S3
+        return s3_key, executor.submit(
+            upload_to_s3, self.bucket_name, s3_key, image_bytes,
+            ImageConstants.CONTENT_TYPES[image_format], self.s3_client
+        )
+    
+    @staticmethod
+    def _upload_failed(uploads: Dict[str, Tuple[str, Any]]) -> bool:
+        """
+        Check whether any finished upload has failed
+        
+        Args:
+            uploads: Dictionary of version_name -> (s3_key, upload future)
+            
+        Returns:
+            True if a completed upload failed
+        """
+        return any(
+            upload.done() and (upload.exception() is not None or not upload.result())
+            for _, upload in uploads.values()
+        )
+    
+    def _collect_version_uploads(
+        self,
+        uploads: Dict[str, Tuple[str, Any]],
+        versions: Dict[str, bytes],
+        photo_id: str
+    ) -> Dict[str, Any]:
+        """
+        Wait for submitted version uploads and gather their results
+        
+        Args:
+            uploads: Dictionary of version_name -> (s3_key, upload future)
+            versions: Dictionary of version_name -> image_bytes
             photo_id: Photo ID
             
         Returns:
@@ -424,16 +562,21 @@ class PhotoService:
         }
         
         for version_name, image_bytes in versions.items():
+            # Fail fast: once a version failed, drop uploads not yet started
+            upload = uploads.get(version_name)
+            if upload_results['upload_errors'] and (upload is None or upload[1].cancel()):
+                upload = None
+            if upload is None:
+                upload_results['upload_success'][version_name] = False
+                upload_results['upload_errors'].append({
+                    'version': version_name,
+                    'error': 'Upload skipped after an earlier version failed'
+                })
+                continue
+            
             try:
-                # Generate S3 key
-                s3_key = generate_s3_key(
-                    entity_type, entity_id, photo_type, version_name
-                )
-                
-                # Upload to S3
-                upload_success = upload_to_s3(
-                    self.bucket_name, s3_key, image_bytes, 'image/jpeg'
-                )
+                s3_key, upload = upload
+                upload_success = upload.result()
                 
                 if upload_success:
                     upload_results['s3_keys'][version_name] = s3_key
@@ -487,6 +630,7 @@ class PhotoService:
         """
         urls = {}
         s3_keys = upload_results['s3_keys']
+        s3_client = self.s3_client
         
         # Thumbnail URL (public)
         if 'thumbnail' in s3_keys:
@@ -497,12 +641,12 @@ class PhotoService:
         # Protected URLs (presigned)
         if 'standard' in s3_keys:
             urls['standard_url'] = generate_presigned_url(
-                self.bucket_name, s3_keys['standard']
+                self.bucket_name, s3_keys['standard'], self.presigned_url_expiry, s3_client
             )
         
         if 'high_res' in s3_keys:
             urls['high_res_url'] = generate_presigned_url(
-                self.bucket_name, s3_keys['high_res']
+                self.bucket_name, s3_keys['high_res'], self.presigned_url_expiry, s3_client
             )
         
         return urls
@@ -517,7 +661,8 @@ class PhotoService:
         urls: Dict[str, str],
         processing_result: Dict[str, Any],
         uploaded_by: str = None,
-        upload_source: str = None
+        upload_source: str = None,
+        processed_sizes: Optional[Dict[str, int]] = None
     ) -> Photo:
         """
         Create photo database record
@@ -532,10 +677,22 @@ class PhotoService:
             processing_result: Image processing results
             uploaded_by: User who uploaded
             upload_source: Source service
+            processed_sizes: File size per version (derived from the
+                             processing stats when not provided)
             
         Returns:
             Created Photo instance
         """
+        original_info = processing_result['original_info']
+        processing_stats = processing_result['processing_stats']
+        width, height = original_info['size']
+        
+        if processed_sizes is None:
+            processed_sizes = {
+                version: stats['file_size']
+                for version, stats in processing_stats.items()
+            }
+        
         photo_data = {
             'photo_id': photo_id,
             'entity_type': entity_type,
@@ -546,29 +703,88 @@ class PhotoService:
             'standard_key': s3_keys.get('standard'),
             'high_res_key': s3_keys.get('high_res'),
             'thumbnail_url': urls.get('thumbnail_url'),
-            'file_size': processing_result['original_info']['file_size'],
-            'processed_sizes': {
-                version: stats['file_size']
-                for version, stats in processing_result['processing_stats'].items()
-            },
-            'image_format': processing_result['original_info']['format'],
+            'file_size': original_info['file_size'],
+            'processed_sizes': processed_sizes,
+            'image_format': original_info['format'],
             'image_dimensions': {
-                'width': processing_result['original_info']['size'][0],
-                'height': processing_result['original_info']['size'][1]
+                'width': width,
+                'height': height
             },
-            'processing_stats': processing_result['processing_stats'],
+            'processing_stats': processing_stats,
             'uploaded_by': uploaded_by,
             'upload_source': upload_source
         }
         
         return Photo.create_photo(photo_data)
     
+    def _delete_photos_and_objects(
+        self,
+        photos: List[Photo]
+    ) -> Tuple[List[str], List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Delete photo records and their S3 objects concurrently
+        
+        Args:
+            photos: Photos to delete
+            
+        Returns:
+            Tuple of (deleted_photo_ids, failed_deletions, s3_deletion_result)
+        """
+        # Collect S3 keys
+        s3_keys_to_delete = [
+            key
+            for photo in photos
+            for key in (photo.thumbnail_key, photo.standard_key, photo.high_res_key)
+            if key
+        ]
+        
+        # The S3 batch delete does not depend on the database deletes, so it
+        # runs alongside them
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            s3_deletion = executor.submit(
+                delete_s3_objects, self.bucket_name, s3_keys_to_delete, self.s3_client
+            )
+            
+            # Delete database records in batches
+            deleted_photo_ids, failed_deletions = Photo.delete_photos(photos)
+        
+        return deleted_photo_ids, failed_deletions, s3_deletion.result()
+    
+    def _get_cleanup_candidates(
+        self,
+        entity_type: str,
+        entity_id: str,
+        photo_type: str
+    ) -> Optional[List[Photo]]:
+        """
+        Get existing photos of a type ahead of cleanup
+        
+        Args:
+            entity_type: Entity type
+            entity_id: Entity ID
+            photo_type: Photo type
+            
+        Returns:
+            Photos newest first, or None if the lookup failed
+        """
+        try:
+            return Photo.get_entity_photo_keys(entity_type, entity_id, photo_type, limit=100)
+        except Exception as e:
+            # Cleanup falls back to querying after the upload
+            logger.warning("Photo cleanup lookup failed", 
+                          error=str(e),
+                          entity_type=entity_type,
+                          entity_id=entity_id,
+                          photo_type=photo_type)
+            return None
+    
     def _cleanup_old_photos(
         self,
         entity_type: str,
         entity_id: str,
         photo_type: str,
-        keep_count: int = 1
+        keep_count: int = 1,
+        existing_photos: Optional[List[Photo]] = None
     ) -> Dict[str, Any]:
         """
         Clean up old photos, keeping only the most recent
@@ -578,19 +794,24 @@ class PhotoService:
             entity_id: Entity ID
             photo_type: Photo type
             keep_count: Number of photos to keep
+            existing_photos: Photos looked up before the newest photo was
+                             stored (queried here when not provided)
             
         Returns:
             Cleanup results
         """
         try:
-            # Get all photos for cleanup
-            old_photos = Photo.get_entity_photos(
-                entity_type, entity_id, photo_type, limit=100
-            )
-            
-            # Sort by creation date (newest first) and skip the ones to keep
-            old_photos.sort(key=lambda p: p.created_at, reverse=True)
-            photos_to_delete = old_photos[keep_count:]
+            if existing_photos is not None:
+                # The newest photo is not in the list but counts towards keep_count
+                photos_to_delete = existing_photos[max(keep_count - 1, 0):]
+            else:
+                # Get all photos for cleanup (the index returns them newest first)
+                old_photos = Photo.get_entity_photo_keys(
+                    entity_type, entity_id, photo_type, limit=100
+                )
+                
+                # Skip the ones to keep
+                photos_to_delete = old_photos[keep_count:]
             
             if not photos_to_delete:
                 return {
@@ -599,31 +820,8 @@ class PhotoService:
                     's3_cleanup': {'deleted_count': 0, 'failed_count': 0}
                 }
             
-            # Collect S3 keys and delete photos
-            s3_keys_to_delete = []
-            deleted_photo_ids = []
-            
-            for photo in photos_to_delete:
-                try:
-                    # Collect S3 keys
-                    photo_s3_keys = [
-                        photo.thumbnail_key,
-                        photo.standard_key,
-                        photo.high_res_key
-                    ]
-                    s3_keys_to_delete.extend([key for key in photo_s3_keys if key])
-                    
-                    # Delete database record
-                    photo.delete_photo()
-                    deleted_photo_ids.append(photo.photo_id)
-                    
-                except Exception as e:
-                    logger.error("Failed to cleanup old photo", 
-                               error=e,
-                               photo_id=photo.photo_id)
-            
-            # Delete S3 objects
-            s3_cleanup_result = delete_s3_objects(self.bucket_name, s3_keys_to_delete)
+            # Delete database records and S3 objects
+            deleted_photo_ids, _, s3_cleanup_result = self._delete_photos_and_objects(photos_to_delete)
             
             result = {
                 'deleted_count': len(deleted_photo_ids),
@@ -654,5 +852,15 @@ class PhotoService:
             }
 
 
+@lru_cache(maxsize=PRESIGNED_URL_CACHE_SIZE)
+def _get_cached_presigned_url(s3_client, bucket_name: str, s3_key: str, expiry: int,
+                              ttl_bucket: int) -> Optional[str]:
+    """Cached generate_presigned_url keyed by TTL bucket (failures raise so they aren't cached)"""
+    url = generate_presigned_url(bucket_name, s3_key, expiry, s3_client)
+    if url is None:
+        raise ValueError(f"Failed to generate presigned URL for {s3_key}")
+    return url
+
+
 # Global photo service instance
 photo_service = PhotoService()
\ No newline at end of file
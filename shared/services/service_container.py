@@ -12,6 +12,12 @@ class ServiceContainer:
     Provides lazy loading of services to avoid circular imports
     """
     
+    # Service name -> factory
+    _FACTORY = {
+        'photo_service': PhotoService,
+        'user_org_service': UserOrgService
+    }
+    
     def __init__(self):
         self._services: Dict[str, Any] = {}
     
@@ -28,10 +34,11 @@ class ServiceContainer:
         Raises:
             ValueError: If service is not registered
         """
-        if service_name not in self._services:
-            self._services[service_name] = self._create_service(service_name)
-        
-        return self._services[service_name]
+        try:
+            return self._services[service_name]
+        except KeyError:
+            service = self._services[service_name] = self._create_service(service_name)
+            return service
     
     def _create_service(self, service_name: str):
         """
@@ -46,12 +53,11 @@ class ServiceContainer:
         Raises:
             ValueError: If service is unknown
         """
-        if service_name == 'photo_service':
-            return PhotoService()
-        elif service_name == 'user_org_service':
-            return UserOrgService()
-        else:
+        try:
+            factory = self._FACTORY[service_name]
+        except KeyError:
             raise ValueError(f"Unknown service: {service_name}")
+        return factory()
     
     def register_service(self, service_name: str, service_instance):
         """
@@ -2,14 +2,49 @@
 User-Organization Service
 Business logic for managing users and organizations in unified table
 """
+import base64
+import binascii
+import json
+import re
 import uuid
-from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any
+from itertools import islice
+from typing import Dict, List, Optional, Any, Tuple
+from pynamodb.exceptions import PutError
 from ..models.user_org import UserOrg
+from ..models.search_index import UserOrgSearchToken, SEARCH_TOKEN_LENGTH
 from ..config import config
 from ..logger import logger
 from ..exceptions import ValidationError, DuplicateEntityError, EntityNotFoundError
 from ..constants import EntityConstants
+from ..validation_utils import utc_now_iso
+
+
+# Letters, numbers and underscores, 3-30 characters
+_NICKNAME_RE = re.compile(r'\w{3,30}\Z')
+
+# Candidates hydrated per text search page: limit * factor, at least the minimum
+_TOKEN_CANDIDATE_FACTOR = 5
+_MIN_TOKEN_CANDIDATES = 100
+
+
+def _encode_cursor(last_evaluated_key: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Encode a DynamoDB last evaluated key as an opaque URL-safe cursor"""
+    if not last_evaluated_key:
+        return None
+    return base64.urlsafe_b64encode(
+        json.dumps(last_evaluated_key, separators=(',', ':')).encode()
+    ).decode()
+
+
+def _decode_cursor(cursor: str) -> Dict[str, Any]:
+    """Decode a cursor produced by _encode_cursor back into a last evaluated key"""
+    try:
+        last_evaluated_key = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, ValueError) as e:
+        raise ValidationError(f"Invalid pagination key: {e}")
+    if not isinstance(last_evaluated_key, dict):
+        raise ValidationError("Invalid pagination key")
+    return last_evaluated_key
 
 
 class UserOrgService:
@@ -57,12 +92,8 @@ class UserOrgService:
         # Validate input
         self._validate_create_input(nickname, full_name, user_type)
         
-        # Check if nickname already exists
-        if self._nickname_exists(nickname):
-            raise DuplicateEntityError(f"Nickname '{nickname}' already exists")
-        
         # Create entity
-        current_time = datetime.now(timezone.utc).isoformat()
+        current_time = utc_now_iso()
         
         entity = UserOrg(
             nickname=nickname,
@@ -81,15 +112,16 @@ class UserOrgService:
         )
         
         try:
-            entity.save()
+            # Conditional put doubles as the existence check
+            entity.save(condition=UserOrg.nickname.does_not_exist())
             logger.info(f"Created {user_type}: {nickname}")
             
             return self._entity_to_dict(entity)
             
         except Exception as e:
             logger.error(f"Failed to create {user_type} {nickname}", error=e)
-            if "ConditionalCheckFailedException" in str(e):
-                raise DuplicateEntityError(f"Nickname '{nickname}' already exists")
+            if isinstance(e, PutError) and e.cause_response_code == 'ConditionalCheckFailedException':
+                raise DuplicateEntityError(user_type, 'nickname', nickname) from e
             raise
     
     def get_entity(
@@ -108,7 +140,10 @@ class UserOrgService:
             Entity data or None if not found
         """
         try:
-            entity = UserOrg.get(nickname)
+            # Served from the model's short-TTL lookup cache
+            entity = UserOrg.get_by_nickname(nickname)
+            if entity is None:
+                return None
             
             # Check if entity is active (unless explicitly including inactive)
             if not include_inactive and not entity.is_active:
@@ -116,8 +151,6 @@ class UserOrgService:
             
             return self._entity_to_dict(entity)
             
-        except UserOrg.DoesNotExist:
-            return None
         except Exception as e:
             logger.error(f"Failed to get entity {nickname}", error=e)
             raise
@@ -157,7 +190,7 @@ class UserOrgService:
                 setattr(entity, field, value)
         
         # Update metadata
-        entity.updated_at = datetime.now(timezone.utc).isoformat()
+        entity.updated_at = utc_now_iso()
         if updated_by:
             entity.updated_by = updated_by
         entity.version += 1
@@ -200,7 +233,7 @@ class UserOrgService:
         if soft_delete:
             # Soft delete - mark as inactive
             entity.is_active = False
-            entity.deleted_at = datetime.now(timezone.utc).isoformat()
+            entity.deleted_at = utc_now_iso()
             if deleted_by:
                 entity.deleted_by = deleted_by
             entity.version += 1
@@ -223,7 +256,7 @@ class UserOrgService:
                 'success': True,
                 'operation': 'hard_delete',
                 'nickname': nickname,
-                'deleted_at': datetime.now(timezone.utc).isoformat()
+                'deleted_at': utc_now_iso()
             }
     
     def search_entities(
@@ -242,16 +275,29 @@ class UserOrgService:
             entity_type: Filter by entity type ('user' or 'organization')
             certified_only: Whether to return only certified entities
             limit: Maximum number of results
-            last_evaluated_key: Pagination key
+            last_evaluated_key: Pagination cursor returned by the previous page
             
         Returns:
             Search results with pagination info
         """
         results = []
+        next_key = None
         
         try:
+            # Text queries long enough for the token index skip the table scan
+            # (once the index has been backfilled and the flag turned on)
+            if query and len(query) >= SEARCH_TOKEN_LENGTH and config.user_org_token_search:
+                after = None
+                if last_evaluated_key:
+                    after = _decode_cursor(last_evaluated_key).get('after')
+                    if not isinstance(after, str):
+                        raise ValidationError("Invalid pagination key for a text search")
+                results, next_key = self._search_by_token(
+                    query, entity_type, certified_only, limit, after
+                )
+            
             # Search by entity type if specified
-            if entity_type:
+            elif entity_type:
                 index = UserOrg.user_type_index
                 scan_kwargs = {
                     'limit': limit,
@@ -260,7 +306,7 @@ class UserOrgService:
                 
                 # Add pagination
                 if last_evaluated_key:
-                    scan_kwargs['last_evaluated_key'] = last_evaluated_key
+                    scan_kwargs['last_evaluated_key'] = _decode_cursor(last_evaluated_key)
                 
                 # Build filter conditions
                 filter_conditions = []
@@ -293,6 +339,7 @@ class UserOrgService:
                 )
                 
                 results = [self._entity_to_dict(entity) for entity in scan_result]
+                next_key = scan_result.last_evaluated_key
                 
             else:
                 # Scan all entities
@@ -303,7 +350,7 @@ class UserOrgService:
                 
                 # Add pagination
                 if last_evaluated_key:
-                    scan_kwargs['last_evaluated_key'] = last_evaluated_key
+                    scan_kwargs['last_evaluated_key'] = _decode_cursor(last_evaluated_key)
                 
                 # Build filter conditions
                 filter_conditions = []
@@ -332,6 +379,7 @@ class UserOrgService:
                 # Execute scan
                 scan_result = UserOrg.scan(**scan_kwargs)
                 results = [self._entity_to_dict(entity) for entity in scan_result]
+                next_key = scan_result.last_evaluated_key
             
             return {
                 'results': results,
@@ -339,13 +387,71 @@ class UserOrgService:
                 'query': query,
                 'entity_type': entity_type,
                 'certified_only': certified_only,
-                'last_evaluated_key': getattr(scan_result, 'last_evaluated_key', None)
+                'last_evaluated_key': _encode_cursor(next_key)
             }
             
         except Exception as e:
             logger.error(f"Failed to search entities with query: {query}", error=e)
             raise
     
+    def _search_by_token(
+        self,
+        query: str,
+        entity_type: Optional[str],
+        certified_only: bool,
+        limit: int,
+        after: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, str]]]:
+        """
+        Search entities through the search token index
+        
+        Candidates are visited in nickname order, so a page can resume
+        after the last nickname it consumed. At most
+        max(limit * _TOKEN_CANDIDATE_FACTOR, _MIN_TOKEN_CANDIDATES) candidates
+        are hydrated per page; when that budget runs out before the page is
+        full, the cursor resumes after the last candidate examined.
+        
+        Args:
+            query: Search query string (at least SEARCH_TOKEN_LENGTH chars)
+            entity_type: Filter by entity type
+            certified_only: Whether to return only certified entities
+            limit: Maximum number of results
+            after: Nickname the previous page stopped at
+            
+        Returns:
+            Tuple of (matching entities as dictionaries, next page key or None)
+        """
+        results = []
+        budget = max(limit * _TOKEN_CANDIDATE_FACTOR, _MIN_TOKEN_CANDIDATES)
+        nicknames = islice(UserOrgSearchToken.iter_nicknames(query.lower(), after=after), budget)
+        examined = 0
+        
+        # BatchGetItem accepts at most 100 keys per request
+        while chunk := list(islice(nicknames, 100)):
+            examined += len(chunk)
+            last_examined = chunk[-1]
+            # batch_get returns items in arbitrary order; restore candidate order
+            entities = {entity.nickname: entity for entity in UserOrg.batch_get(chunk)}
+            for nickname in chunk:
+                entity = entities.get(nickname)
+                if entity is None:
+                    continue
+                if entity_type and entity.user_type != entity_type:
+                    continue
+                if certified_only and entity.is_certified != 'yes':
+                    continue
+                if not entity.is_active:
+                    continue
+                if query in entity.nickname or (entity.full_name and query in entity.full_name):
+                    results.append(self._entity_to_dict(entity))
+                    if len(results) == limit:
+                        return results, {'after': nickname}
+        
+        # Budget spent before the page filled; more candidates may follow
+        if examined == budget:
+            return results, {'after': last_examined}
+        return results, None
+    
     def _validate_create_input(self, nickname: str, full_name: str, user_type: str):
         """Validate input for entity creation"""
         if not nickname or not nickname.strip():
@@ -357,17 +463,18 @@ class UserOrgService:
         if user_type not in ['user', 'organization']:
             raise ValidationError("user_type must be 'user' or 'organization'")
         
-        # Validate nickname format
+        # Validate nickname format in one pass; pick the message only on failure
         nickname = nickname.strip().lower()
+        if _NICKNAME_RE.match(nickname):
+            return
+        
         if len(nickname) < 3:
             raise ValidationError("Nickname must be at least 3 characters long")
         
         if len(nickname) > 30:
             raise ValidationError("Nickname must be no more than 30 characters long")
         
-        # Check for valid characters (alphanumeric and underscores)
-        if not nickname.replace('_', '').isalnum():
-            raise ValidationError("Nickname can only contain letters, numbers, and underscores")
+        raise ValidationError("Nickname can only contain letters, numbers, and underscores")
     
     def _validate_update_input(self, updates: Dict[str, Any]):
         """Validate input for entity updates"""
@@ -391,14 +498,6 @@ class UserOrgService:
             if updates['is_certified'] not in ['yes', 'no', True, False]:
                 raise ValidationError("is_certified must be 'yes', 'no', True, or False")
     
-    def _nickname_exists(self, nickname: str) -> bool:
-        """Check if nickname already exists"""
-        try:
-            UserOrg.get(nickname)
-            return True
-        except UserOrg.DoesNotExist:
-            return False
-    
     def _entity_to_dict(self, entity: UserOrg) -> Dict[str, Any]:
         """Convert entity to dictionary"""
         return {
@@ -1,17 +1,50 @@
 """
 AWS-specific utilities for commons-service
 """
-import json
-import hashlib
+import base64
+import io
+import threading
 import uuid
-from datetime import datetime, timezone
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import md5, sha256
+from typing import Dict, Any, List, Optional, Tuple, Union
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config as BotoConfig
 from botocore.exceptions import ClientError
-from .constants import HTTPConstants
-from .validation_utils import generate_storage_key
+from .constants import HTTPConstants, EntityConstants, S3Constants
+from .validation_utils import generate_storage_key, utc_now_iso, utc_timestamp_compact
 from .config import config
 from .logger import logger
+from .json_utils import json_dumps
+
+# S3 DeleteObjects accepts at most 1000 keys per request
+S3_DELETE_BATCH_SIZE = 1000
+S3_DELETE_MAX_WORKERS = 4
+
+# Default response headers; copied into each response, never handed out directly
+_DEFAULT_HEADERS = {
+    'Content-Type': 'application/json',
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token',
+    'Access-Control-Allow-Methods': 'GET,POST,PUT,DELETE,OPTIONS'
+}
+
+# One-shot OpenSSL constructors; hardware SHA/MD5 paths are used when available
+_HASHERS = {'md5': md5, 'sha256': sha256}
+
+# Process-wide S3 client, created on first use and reused across warm invocations
+_s3_client = None
+_s3_client_lock = threading.Lock()
+
+# Payloads at or above this size are uploaded as parallel multipart parts
+S3_MULTIPART_THRESHOLD = 8 * 1024 * 1024
+S3_MULTIPART_CONFIG = TransferConfig(
+    multipart_threshold=S3_MULTIPART_THRESHOLD,
+    multipart_chunksize=S3_MULTIPART_THRESHOLD,
+    max_concurrency=4,
+    use_threads=True
+)
 
 
 def create_response(status_code: int, body: str, event: Optional[dict] = None, headers: Optional[dict] = None) -> Dict[str, Any]:
@@ -27,19 +60,9 @@ def create_response(status_code: int, body: str, event: Optional[dict] = None, h
     Returns:
         Lambda proxy integration response
     """
-    default_headers = {
-        'Content-Type': 'application/json',
-        'Access-Control-Allow-Origin': '*',
-        'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token',
-        'Access-Control-Allow-Methods': 'GET,POST,PUT,DELETE,OPTIONS'
-    }
-    
-    if headers:
-        default_headers.update(headers)
-    
     return {
         'statusCode': status_code,
-        'headers': default_headers,
+        'headers': {**_DEFAULT_HEADERS, **headers} if headers else dict(_DEFAULT_HEADERS),
         'body': body
     }
 
@@ -60,13 +83,37 @@ def create_error_response(status_code: int, message: str, event: Optional[dict]
     error_body = {
         'success': False,
         'error': message,
-        'timestamp': datetime.now(timezone.utc).isoformat()
+        'timestamp': utc_now_iso()
     }
     
     if details:
         error_body.update(details)
     
-    return create_response(status_code, json.dumps(error_body), event)
+    return create_response(status_code, json_dumps(error_body), event)
+
+
+def get_s3_client():
+    """
+    Get the shared S3 client
+    
+    Created once per process with keep-alive, a connection pool sized for the
+    upload/delete threads and adaptive retries; safe to call from threads.
+    
+    Returns:
+        boto3 S3 client
+    """
+    global _s3_client
+    if _s3_client is None:
+        with _s3_client_lock:
+            if _s3_client is None:
+                _s3_client = boto3.client('s3', config=BotoConfig(
+                    connect_timeout=S3Constants.CONNECT_TIMEOUT_SECONDS,
+                    read_timeout=S3Constants.READ_TIMEOUT_SECONDS,
+                    retries={'mode': 'adaptive', 'max_attempts': S3Constants.MAX_RETRY_ATTEMPTS},
+                    max_pool_connections=S3Constants.MAX_POOL_CONNECTIONS,
+                    tcp_keepalive=True
+                ))
+    return _s3_client
 
 
 def generate_s3_key(entity_type: str, entity_id: str, photo_type: str, version: str, file_extension: str = 'jpg') -> str:
@@ -83,7 +130,7 @@ def generate_s3_key(entity_type: str, entity_id: str, photo_type: str, version:
     Returns:
         S3 object key
     """
-    timestamp = datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')
+    timestamp = utc_timestamp_compact()
     unique_id = str(uuid.uuid4())[:8]
     filename = f"{version}_{timestamp}_{unique_id}.{file_extension}"
     
@@ -97,12 +144,13 @@ def generate_photo_id() -> str:
     Returns:
         Unique photo identifier
     """
-    timestamp = datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')
+    timestamp = utc_timestamp_compact()
     unique_id = str(uuid.uuid4())[:8]
     return f"photo_{timestamp}_{unique_id}"
 
 
-def generate_presigned_url(bucket_name: str, s3_key: str, expiry_seconds: Optional[int] = None) -> Optional[str]:
+def generate_presigned_url(bucket_name: str, s3_key: str, expiry_seconds: Optional[int] = None,
+                           s3_client=None) -> Optional[str]:
     """
     Generate presigned URL for S3 object
     
@@ -110,6 +158,7 @@ def generate_presigned_url(bucket_name: str, s3_key: str, expiry_seconds: Option
         bucket_name: S3 bucket name
         s3_key: S3 object key
         expiry_seconds: URL expiry in seconds (default from config)
+        s3_client: Optional S3 client to reuse (keeps its resolved endpoint and signer)
         
     Returns:
         Presigned URL or None if error
@@ -118,7 +167,8 @@ def generate_presigned_url(bucket_name: str, s3_key: str, expiry_seconds: Option
         expiry_seconds = config.presigned_url_expiry
     
     try:
-        s3_client = boto3.client('s3')
+        if s3_client is None:
+            s3_client = get_s3_client()
         presigned_url = s3_client.generate_presigned_url(
             'get_object',
             Params={'Bucket': bucket_name, 'Key': s3_key},
@@ -167,7 +217,7 @@ def create_success_response(data: Any, metadata: Optional[Dict[str, Any]] = None
     
     # Build metadata
     response_metadata = {
-        "timestamp": datetime.now(timezone.utc).isoformat() + "Z"
+        "timestamp": utc_now_iso() + "Z"
     }
     
     if function_name:
@@ -207,7 +257,7 @@ def create_failure_response(error_code: str, message: str, details: Optional[Dic
     
     # Build metadata
     response_metadata = {
-        "timestamp": datetime.now(timezone.utc).isoformat() + "Z"
+        "timestamp": utc_now_iso() + "Z"
     }
     
     if function_name:
@@ -229,21 +279,21 @@ def calculate_file_hash(data: bytes, algorithm: str = 'md5') -> str:
     Returns:
         Hex digest of hash
     """
-    if algorithm == 'md5':
-        return hashlib.md5(data).hexdigest()
-    elif algorithm == 'sha256':
-        return hashlib.sha256(data).hexdigest()
-    else:
+    try:
+        hasher = _HASHERS[algorithm]
+    except KeyError:
         raise ValueError(f"Unsupported hash algorithm: {algorithm}")
+    return hasher(data).hexdigest()
 
 
-def delete_s3_objects(bucket_name: str, s3_keys: list) -> Dict[str, Any]:
+def delete_s3_objects(bucket_name: str, s3_keys: list, s3_client=None) -> Dict[str, Any]:
     """
     Delete multiple S3 objects in batch
     
     Args:
         bucket_name: S3 bucket name
         s3_keys: List of S3 keys to delete
+        s3_client: Optional S3 client to reuse (shared by the chunk threads)
         
     Returns:
         Deletion result summary
@@ -252,22 +302,24 @@ def delete_s3_objects(bucket_name: str, s3_keys: list) -> Dict[str, Any]:
         return {'deleted_count': 0, 'failed_count': 0, 'errors': []}
     
     try:
-        s3_client = boto3.client('s3')
+        if s3_client is None:
+            s3_client = get_s3_client()
+        chunks = [
+            s3_keys[i:i + S3_DELETE_BATCH_SIZE]
+            for i in range(0, len(s3_keys), S3_DELETE_BATCH_SIZE)
+        ]
         
-        # Prepare objects for batch deletion
-        delete_objects = [{'Key': key} for key in s3_keys]
-        
-        response = s3_client.delete_objects(
-            Bucket=bucket_name,
-            Delete={
-                'Objects': delete_objects,
-                'Quiet': False  # Return info about deleted objects
-            }
-        )
+        if len(chunks) == 1:
+            chunk_results = [_delete_s3_chunk(s3_client, bucket_name, chunks[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(S3_DELETE_MAX_WORKERS, len(chunks))) as executor:
+                chunk_results = list(executor.map(
+                    lambda chunk: _delete_s3_chunk(s3_client, bucket_name, chunk), chunks
+                ))
         
-        deleted_count = len(response.get('Deleted', []))
-        errors = response.get('Errors', [])
-        failed_count = len(errors)
+        deleted_count = sum(deleted for deleted, _, _ in chunk_results)
+        failed_count = sum(failed for _, failed, _ in chunk_results)
+        errors = [error for _, _, chunk_errors in chunk_results for error in chunk_errors]
         
         logger.info("S3 batch deletion completed", 
                    bucket=bucket_name, 
@@ -281,14 +333,6 @@ def delete_s3_objects(bucket_name: str, s3_keys: list) -> Dict[str, Any]:
             'success': failed_count == 0
         }
     
-    except ClientError as e:
-        logger.error("S3 batch deletion failed", error=e, bucket=bucket_name, keys_count=len(s3_keys))
-        return {
-            'deleted_count': 0,
-            'failed_count': len(s3_keys),
-            'errors': [str(e)],
-            'success': False
-        }
     except Exception as e:
         logger.error("Unexpected error in S3 batch deletion", error=e, bucket=bucket_name)
         return {
@@ -299,7 +343,36 @@ def delete_s3_objects(bucket_name: str, s3_keys: list) -> Dict[str, Any]:
         }
 
 
-def upload_to_s3(bucket_name: str, s3_key: str, data: bytes, content_type: str = 'image/jpeg') -> bool:
+def _delete_s3_chunk(s3_client, bucket_name: str, s3_keys: List[str]) -> Tuple[int, int, list]:
+    """
+    Delete up to S3_DELETE_BATCH_SIZE objects with a single DeleteObjects request
+    
+    Args:
+        s3_client: S3 client
+        bucket_name: S3 bucket name
+        s3_keys: S3 keys to delete
+        
+    Returns:
+        Tuple of (deleted_count, failed_count, errors)
+    """
+    try:
+        response = s3_client.delete_objects(
+            Bucket=bucket_name,
+            Delete={
+                'Objects': [{'Key': key} for key in s3_keys],
+                'Quiet': True  # Only report failures
+            }
+        )
+        errors = response.get('Errors', [])
+        return len(s3_keys) - len(errors), len(errors), errors
+    
+    except ClientError as e:
+        logger.error("S3 batch deletion failed", error=e, bucket=bucket_name, keys_count=len(s3_keys))
+        return 0, len(s3_keys), [str(e)]
+
+
+def upload_to_s3(bucket_name: str, s3_key: str, data: bytes, content_type: str = 'image/jpeg',
+                 s3_client=None) -> bool:
     """
     Upload data to S3
     
@@ -308,21 +381,31 @@ def upload_to_s3(bucket_name: str, s3_key: str, data: bytes, content_type: str =
         s3_key: S3 object key
         data: File data to upload
         content_type: MIME content type
+        s3_client: Optional S3 client to reuse (required when called from threads)
         
     Returns:
         True if successful, False otherwise
     """
     try:
-        s3_client = boto3.client('s3')
+        if s3_client is None:
+            s3_client = get_s3_client()
         
-        s3_client.put_object(
-            Bucket=bucket_name,
-            Key=s3_key,
-            Body=data,
-            ContentType=content_type
-        )
+        if len(data) >= S3_MULTIPART_THRESHOLD:
+            s3_client.upload_fileobj(
+                io.BytesIO(data), bucket_name, s3_key,
+                ExtraArgs={'ContentType': content_type},
+                Config=S3_MULTIPART_CONFIG
+            )
+        else:
+            s3_client.put_object(
+                Bucket=bucket_name,
+                Key=s3_key,
+                Body=data,
+                ContentType=content_type
+            )
         
-        logger.info("S3 upload successful", bucket=bucket_name, key=s3_key, size=len(data))
+        if logger.info_enabled:
+            logger.info("S3 upload successful", bucket=bucket_name, key=s3_key, size=len(data))
         return True
     
     except ClientError as e:
@@ -333,12 +416,12 @@ def upload_to_s3(bucket_name: str, s3_key: str, data: bytes, content_type: str =
         return False
 
 
-def parse_base64_image(image_data: str) -> bytes:
+def parse_base64_image(image_data: Union[str, bytes]) -> bytes:
     """
     Parse base64 encoded image data
     
     Args:
-        image_data: Base64 encoded image string (with or without data URL prefix)
+        image_data: Base64 encoded image string or bytes (with or without data URL prefix)
         
     Returns:
         Image bytes
@@ -346,14 +429,18 @@ def parse_base64_image(image_data: str) -> bytes:
     Raises:
         ValueError: If image data is invalid
     """
-    import base64
-    
     if not image_data:
         raise ValueError("No image data provided")
     
-    # Remove data URL prefix if present (data:image/jpeg;base64,...)
-    if ',' in image_data and image_data.startswith('data:'):
-        image_data = image_data.split(',')[1]
+    # Remove data URL prefix if present (data:image/jpeg;base64,...) with one find/slice
+    if isinstance(image_data, str):
+        prefix, separator = 'data:', ','
+    else:
+        prefix, separator = b'data:', b','
+    if image_data[:5] == prefix:
+        comma = image_data.find(separator, 5)
+        if comma != -1:
+            image_data = image_data[comma + 1:]
     
     try:
         return base64.b64decode(image_data)
@@ -373,7 +460,6 @@ def validate_entity_type(entity_type: str, valid_types: Optional[list] = None) -
         True if valid, False otherwise
     """
     if valid_types is None:
-        from .constants import EntityConstants
         valid_types = EntityConstants.ALL_ENTITY_TYPES
     
     return entity_type.lower() in [t.lower() for t in valid_types]
@@ -390,8 +476,6 @@ def validate_photo_type(photo_type: str, entity_type: Optional[str] = None) -> b
     Returns:
         True if valid, False otherwise
     """
-    from .constants import EntityConstants
-    
     if entity_type:
         entity_type = entity_type.lower()
         if entity_type == 'user':
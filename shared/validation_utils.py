@@ -5,13 +5,19 @@ Validation functions migrated from anecdotario-commons
 import re
 import base64
 import hashlib
+import time
 import uuid
-from datetime import datetime, timezone
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Tuple, Union
 
 from .constants import ValidationConstants, EntityConstants, ImageConstants
 from .exceptions import ValidationError
 
+try:
+    import pybase64
+    _b64decode = pybase64.b64decode
+except ImportError:  # pragma: no cover - falls back to the scalar stdlib decoder
+    _b64decode = base64.b64decode
+
 
 def validate_required_fields(data: Dict[str, Any], required_fields: List[str]) -> List[str]:
     """
@@ -93,12 +99,12 @@ def validate_nickname(nickname: str, entity_type: str = 'user') -> Dict[str, Any
         result['hints'].append(f'Try shortening the nickname (maximum {ValidationConstants.MAX_NICKNAME_LENGTH} characters)')
     
     # Pattern validation
-    if not re.match(ValidationConstants.NICKNAME_PATTERN, normalized):
+    if not ValidationConstants.NICKNAME_RE.match(normalized):
         result['errors'].append('Nickname can only contain letters, numbers, underscores, and hyphens')
         result['hints'].append('Use only a-z, A-Z, 0-9, _ and - characters')
     
     # Reserved words validation
-    reserved_words = []
+    reserved_words = frozenset()
     if entity_type == 'user':
         reserved_words = ValidationConstants.RESERVED_USER_NICKNAMES
     elif entity_type == 'org':
@@ -224,12 +230,13 @@ def validate_bio(bio: str) -> Dict[str, Any]:
     return result
 
 
-def parse_base64_image(image_data: str) -> Tuple[str, bytes]:
+def parse_base64_image(image_data: Union[str, bytes, bytearray]) -> Tuple[str, bytes]:
     """
     Parse base64 encoded image data.
     
     Args:
-        image_data: Base64 encoded image string with data URL prefix
+        image_data: Base64 encoded image string with data URL prefix; raw
+                    request bytes are sliced without copying the payload
         
     Returns:
         Tuple of (format, image_bytes)
@@ -237,16 +244,28 @@ def parse_base64_image(image_data: str) -> Tuple[str, bytes]:
     Raises:
         ValidationError: If image data is invalid
     """
-    if not isinstance(image_data, str):
+    if isinstance(image_data, str):
+        prefix, separator, padding = 'data:image/', ',', '='
+    elif isinstance(image_data, (bytes, bytearray)):
+        prefix, separator, padding = b'data:image/', b',', b'='
+    else:
         raise ValidationError('Image data must be a string')
     
     # Check for data URL prefix
-    if not image_data.startswith('data:image/'):
+    if not image_data.startswith(prefix):
         raise ValidationError('Image data must start with data:image/ prefix')
     
     try:
-        # Extract the format and base64 data
-        header, base64_data = image_data.split(',', 1)
+        # Extract the format and base64 data (single find/slice, no split list)
+        comma = image_data.find(separator)
+        if comma == -1:
+            raise ValueError('missing data URL separator')
+        if isinstance(image_data, str):
+            header = image_data[:comma]
+            base64_data = image_data[comma + 1:]
+        else:
+            header = image_data[:comma].decode('ascii')
+            base64_data = memoryview(image_data)[comma + 1:]
         
         # Extract format from header (e.g., "data:image/jpeg;base64" -> "jpeg")
         format_part = header.split('/')[1].split(';')[0].upper()
@@ -264,8 +283,14 @@ def parse_base64_image(image_data: str) -> Tuple[str, bytes]:
         if format_part not in ImageConstants.SUPPORTED_FORMATS:
             raise ValidationError(f'Unsupported image format: {format_part}')
         
-        # Decode base64 data
-        image_bytes = base64.b64decode(base64_data)
+        # Reject oversized payloads from the encoded length, before decoding
+        decoded_size = len(base64_data) * 3 // 4 - image_data.count(padding, -2)
+        if decoded_size > ImageConstants.MAX_FILE_SIZE:
+            max_mb = ImageConstants.MAX_FILE_SIZE / (1024 * 1024)
+            raise ValidationError(f'Image file too large. Maximum size: {max_mb:.1f}MB')
+        
+        # Decode base64 data (strict alphabet check; the fast path in pybase64)
+        image_bytes = _b64decode(base64_data, validate=True)
         
         if len(image_bytes) == 0:
             raise ValidationError('Image data is empty')
@@ -280,6 +305,30 @@ def parse_base64_image(image_data: str) -> Tuple[str, bytes]:
         raise ValidationError(f'Invalid base64 image data: {str(e)}')
 
 
+def utc_now_iso() -> str:
+    """
+    Current UTC time as an ISO 8601 string with microseconds.
+    
+    Formats straight from ``time.time_ns`` so hot response paths skip
+    building timezone-aware datetime objects.
+    
+    Returns:
+        Timestamp such as ``2024-01-01T12:00:00.000000+00:00``
+    """
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    return f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds))}.{nanos // 1000:06d}+00:00"
+
+
+def utc_timestamp_compact() -> str:
+    """
+    Current UTC time formatted for storage keys and IDs.
+    
+    Returns:
+        Timestamp such as ``20240101_120000``
+    """
+    return time.strftime('%Y%m%d_%H%M%S', time.gmtime())
+
+
 def generate_photo_id() -> str:
     """
     Generate a unique photo ID.
@@ -307,7 +356,7 @@ def generate_storage_key(entity_type: str, entity_id: str, photo_type: str, vers
         S3 storage key string
     """
     if not timestamp:
-        timestamp = datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')
+        timestamp = utc_timestamp_compact()
     
     if not hash_suffix:
         # Generate a short hash for uniqueness
@@ -24,7 +24,7 @@ class NicknameValidator:
         }
         
         # Validation patterns
-        self.valid_pattern = re.compile(r'^[a-zA-Z0-9_-]+$')
+        self.valid_pattern = ValidationConstants.NICKNAME_RE
         self.start_pattern = re.compile(r'^[a-zA-Z0-9]')
         self.end_pattern = re.compile(r'[a-zA-Z0-9]$')
         self.consecutive_special = re.compile(r'[-_]{2,}')
@@ -335,8 +335,8 @@ class NicknameValidator:
                 'Cannot be empty'
             ],
             'reserved_words': {
-                'common': list(self.reserved_words['common']),
-                entity_type: list(self.reserved_words.get(entity_type, []))
+                'common': sorted(self.reserved_words['common']),
+                entity_type: sorted(self.reserved_words.get(entity_type, ()))
             },
             'examples': {
                 'user': ['john_doe', 'user123', 'jane-smith', 'developer2024'],
@@ -0,0 +1,126 @@
+"""
+Tests for the UserOrg model and its search token index
+"""
+import pytest
+from unittest.mock import patch
+from moto import mock_aws
+
+# Import under moto so config lookups never reach a real SSM endpoint
+with mock_aws():
+    from shared.models.user_org import UserOrg, _get_cached_raw_entity
+    from shared.models.search_index import UserOrgSearchToken
+
+
+class TestUserOrgModel:
+    """Test suite for UserOrg persistence"""
+
+    @pytest.fixture
+    def tables(self, monkeypatch):
+        """Set up mock UserOrg and search token tables"""
+        monkeypatch.setenv('USER_ORG_TOKEN_SEARCH', 'true')
+        with mock_aws():
+            UserOrg.create_table(wait=True)
+            UserOrgSearchToken.create_table(wait=True)
+            yield
+        _get_cached_raw_entity.cache_clear()
+
+    @pytest.fixture
+    def entity_data(self):
+        """Valid entity creation data with a mixed-case nickname"""
+        return {
+            'nickname': 'Alice_1',
+            'user_type': 'user',
+            'entity_id': 'user-1',
+            'display_name': 'Alice Smith'
+        }
+
+    def test_created_nickname_matches_stored_key(self, tables, entity_data):
+        """Test that a created entity exposes the lowercased stored nickname"""
+        entity = UserOrg.create_entity(entity_data)
+
+        assert entity.nickname == 'alice_1'
+        assert entity.to_dict()['nickname'] == 'alice_1'
+        assert UserOrg.get('alice_1').to_dict()['nickname'] == 'alice_1'
+
+    def test_search_tokens_follow_create_rename_delete(self, tables, entity_data):
+        """Test that token rows are replaced on rename and removed on delete"""
+        UserOrg.create_entity(entity_data)
+        assert {entry.nickname for entry in UserOrgSearchToken.scan()} == {'alice_1'}
+
+        UserOrg.get_by_nickname('alice_1').update_entity({'display_name': 'Zed Person'})
+        tokens = {entry.token for entry in UserOrgSearchToken.scan()}
+        assert 'zed' in tokens
+        assert 'smi' not in tokens
+
+        UserOrg.get_by_nickname('alice_1').delete_entity()
+        assert UserOrgSearchToken.count() == 0
+
+    def test_projected_search_results_are_read_only(self, tables, entity_data):
+        """Test that entities from projected search reads refuse save and delete"""
+        UserOrg.create_entity(entity_data)
+        [entity] = UserOrg.search_entities(query='alice')
+
+        with pytest.raises(ValueError):
+            entity.save()
+        with pytest.raises(ValueError):
+            entity.delete()
+        assert UserOrg.get('alice_1').search_tokens
+
+    def test_rebuild_search_tokens_removes_stale_rows(self, tables, entity_data):
+        """Test that rebuilding the index drops rows keyed by a stale nickname"""
+        UserOrg.create_entity(entity_data)
+        UserOrgSearchToken('ali', 'Alice_1').save()
+        UserOrgSearchToken('gho', 'ghost').save()
+
+        UserOrg.rebuild_search_tokens()
+
+        assert {entry.nickname for entry in UserOrgSearchToken.scan()} == {'alice_1'}
+
+    def test_bulk_set_active_refreshes_cached_lookups(self, tables, entity_data):
+        """Test that bulk updates are visible through the cached lookup"""
+        UserOrg.create_entity(entity_data)
+        assert UserOrg.get_by_nickname('alice_1').is_active
+
+        assert UserOrg.bulk_set_active(['alice_1'], False) == 1
+
+        assert not UserOrg.get_by_nickname('alice_1').is_active
+
+    def test_bulk_set_active_reports_unknown_nicknames(self, tables, entity_data):
+        """Test that an unknown nickname names itself and the updates already applied"""
+        nicknames = [f'user_{i:02d}' for i in range(26)]
+        for nickname in nicknames:
+            UserOrg.create_entity({**entity_data, 'nickname': nickname})
+
+        with pytest.raises(ValueError, match=r"\['ghost'\]; 25 of 27"):
+            UserOrg.bulk_set_active(nicknames + ['ghost'], False)
+
+        assert not UserOrg.get('user_24').is_active
+        assert UserOrg.get('user_25').is_active
+
+    def test_create_rejects_nickname_taken_in_another_case(self, tables, entity_data):
+        """Test that nicknames are unique regardless of case"""
+        UserOrg.create_entity(entity_data)
+
+        with pytest.raises(ValueError, match='already taken'):
+            UserOrg.create_entity({**entity_data, 'nickname': 'ALICE_1'})
+
+    def test_create_conditional_put_catches_stale_existence_check(self, tables, entity_data):
+        """Test that a duplicate is rejected even when the cached lookup misses it"""
+        UserOrg.create_entity(entity_data)
+
+        with patch.object(UserOrg, 'nickname_exists', return_value=False):
+            with pytest.raises(ValueError, match='already taken'):
+                UserOrg.create_entity({**entity_data, 'display_name': 'Impostor'})
+
+        assert UserOrg.get('alice_1').display_name == 'Alice Smith'
+
+    def test_token_search_reads_at_most_limit_candidates(self, tables, entity_data):
+        """Test that a filtered text search stops hydrating candidates at the limit"""
+        for i in range(12):
+            UserOrg.create_entity(dict(entity_data, nickname=f'ann_{i:02d}', entity_id=f'user-{i}'))
+
+        with patch.object(UserOrg, 'batch_get', wraps=UserOrg.batch_get) as batch_get:
+            results = UserOrg.search_entities(query='ann', is_certified=True, limit=5)
+
+        assert results == []
+        assert sum(len(call.args[0]) for call in batch_get.call_args_list) == 5
@@ -0,0 +1,57 @@
+"""
+Tests for UserOrgService create/get/delete persistence paths
+"""
+import pytest
+from unittest.mock import patch
+from botocore.exceptions import ClientError
+from moto import mock_aws
+from pynamodb.exceptions import PutError
+
+# Import under moto so config lookups never reach a real SSM endpoint
+with mock_aws():
+    from shared.models.user_org import UserOrg, _get_cached_raw_entity
+    from shared.models.search_index import UserOrgSearchToken
+    from shared.services.user_org_service import UserOrgService
+    from shared.exceptions import DuplicateEntityError
+
+
+class TestUserOrgService:
+    """Test suite for UserOrgService persistence"""
+
+    @pytest.fixture
+    def user_org_service(self):
+        """Service over mock UserOrg and search token tables"""
+        with mock_aws():
+            UserOrg.create_table(wait=True)
+            UserOrgSearchToken.create_table(wait=True)
+
+            # Results are compared by nickname only
+            with patch.object(UserOrgService, '_entity_to_dict', lambda self, entity: entity.nickname):
+                yield UserOrgService()
+        _get_cached_raw_entity.cache_clear()
+
+    def test_create_maps_failed_conditional_put_to_duplicate(self, user_org_service):
+        """Test that a rejected conditional put surfaces as DuplicateEntityError"""
+        conflict = PutError('Failed to put item', cause=ClientError(
+            {'Error': {'Code': 'ConditionalCheckFailedException', 'Message': 'The conditional request failed'}},
+            'PutItem'
+        ))
+
+        with patch('shared.services.user_org_service.UserOrg') as user_org:
+            user_org.return_value.save.side_effect = conflict
+            with pytest.raises(DuplicateEntityError):
+                user_org_service.create_entity('john_doe', 'John Doe', 'user')
+
+        # The existence check is the conditional put itself
+        condition = user_org.return_value.save.call_args.kwargs['condition']
+        assert condition is user_org.nickname.does_not_exist.return_value
+
+    def test_get_entity_misses_after_hard_delete(self, user_org_service):
+        """Test that a hard delete is not hidden by the cached lookup"""
+        UserOrg(nickname='john_doe', user_type='user', entity_id='u1', display_name='John Doe').save()
+        assert user_org_service.get_entity('john_doe') == 'john_doe'
+
+        user_org_service.delete_entity('john_doe', soft_delete=False)
+
+        assert user_org_service.get_entity('john_doe') is None
+        assert UserOrgSearchToken.count() == 0
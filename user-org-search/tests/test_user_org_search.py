@@ -0,0 +1,114 @@
+"""
+Tests for User-Organization search through UserOrgService
+"""
+import pytest
+from unittest.mock import patch
+from moto import mock_aws
+
+# Import under moto so config lookups never reach a real SSM endpoint
+with mock_aws():
+    from shared.models.user_org import UserOrg, _get_cached_raw_entity
+    from shared.models.search_index import UserOrgSearchToken
+    from shared.services import user_org_service as service_module
+    from shared.services.user_org_service import UserOrgService
+    from shared.exceptions import ValidationError
+
+
+class TestUserOrgSearch:
+    """Test suite for UserOrgService.search_entities"""
+
+    @pytest.fixture
+    def user_org_service(self, monkeypatch):
+        """Service over mock tables holding five matching users and one non-match"""
+        monkeypatch.setenv('USER_ORG_TOKEN_SEARCH', 'true')
+        with mock_aws():
+            UserOrg.create_table(wait=True)
+            UserOrgSearchToken.create_table(wait=True)
+            for nickname in ['ali_e', 'ali_c', 'ali_a', 'ali_d', 'ali_b', 'bob']:
+                UserOrg(
+                    nickname=nickname,
+                    user_type='user',
+                    entity_id=nickname,
+                    display_name=nickname,
+                    full_name=f'{nickname} Person'
+                ).save()
+
+            # Results are compared by nickname only
+            with patch.object(UserOrgService, '_entity_to_dict', lambda self, entity: entity.nickname):
+                yield UserOrgService()
+        _get_cached_raw_entity.cache_clear()
+
+    def test_token_search_pages_without_duplicates(self, user_org_service):
+        """Test that a text search pages through every match exactly once, in order"""
+        pages = []
+        cursor = None
+        while True:
+            page = user_org_service.search_entities('ali', limit=2, last_evaluated_key=cursor)
+            pages.append(page['results'])
+            cursor = page['last_evaluated_key']
+            if cursor is None:
+                break
+
+        assert pages == [['ali_a', 'ali_b'], ['ali_c', 'ali_d'], ['ali_e']]
+
+    def test_token_search_results_are_deterministic(self, user_org_service):
+        """Test that repeated text searches return the same ordered page"""
+        first = user_org_service.search_entities('ali', limit=3)['results']
+
+        assert first == ['ali_a', 'ali_b', 'ali_c']
+        assert user_org_service.search_entities('ali', limit=3)['results'] == first
+
+    def test_token_search_rejects_scan_cursor(self, user_org_service):
+        """Test that a cursor from a scan page is rejected by a text search"""
+        cursor = user_org_service.search_entities('', limit=1)['last_evaluated_key']
+        assert cursor is not None
+
+        with pytest.raises(ValidationError):
+            user_org_service.search_entities('ali', last_evaluated_key=cursor)
+
+    def test_scan_search_pages_with_opaque_cursor(self, user_org_service):
+        """Test that scan pages chain through an opaque cursor without duplicates"""
+        seen = []
+        cursor = None
+        while True:
+            page = user_org_service.search_entities('', limit=2, last_evaluated_key=cursor)
+            seen.extend(page['results'])
+            cursor = page['last_evaluated_key']
+            if cursor is None:
+                break
+            assert isinstance(cursor, str)
+
+        assert sorted(seen) == ['ali_a', 'ali_b', 'ali_c', 'ali_d', 'ali_e', 'bob']
+
+    def test_malformed_cursor_is_rejected(self, user_org_service):
+        """Test that a cursor that isn't one of ours fails validation"""
+        with pytest.raises(ValidationError):
+            user_org_service.search_entities('', last_evaluated_key='not a cursor!')
+
+    def test_token_search_caps_candidates_per_page(self, user_org_service):
+        """Test that a page stops hydrating at the candidate budget and resumes after it"""
+        for i in range(25):
+            UserOrg(
+                nickname=f'ann_{i:02d}',
+                user_type='user',
+                entity_id=f'ann_{i:02d}',
+                display_name='Ann',
+                full_name='Ann Person'
+            ).save()
+
+        with patch.object(service_module, '_MIN_TOKEN_CANDIDATES', 10), \
+                patch.object(UserOrg, 'batch_get', wraps=UserOrg.batch_get) as batch_get:
+            page = user_org_service.search_entities('ann', certified_only=True, limit=1)
+
+        assert page['results'] == []
+        assert sum(len(call.args[0]) for call in batch_get.call_args_list) == 10
+        assert service_module._decode_cursor(page['last_evaluated_key']) == {'after': 'ann_09'}
+
+    def test_text_search_scans_until_token_search_is_enabled(self, user_org_service, monkeypatch):
+        """Test that text search ignores the token table while the flag is off"""
+        UserOrgSearchToken.delete_stale({})
+        monkeypatch.delenv('USER_ORG_TOKEN_SEARCH')
+
+        results = user_org_service.search_entities('ali', limit=10)['results']
+
+        assert sorted(results) == ['ali_a', 'ali_b', 'ali_c', 'ali_d', 'ali_e']